@@ -1,12 +1,68 @@
+import argparse
+import sys
+from typing import get_args
+
+import src.comandos as comandos
 import src.lib.consola as cli
-from src.controlador import menu_acceso
+from src.controlador import (
+    ejecutar,
+    exportar_todos,
+    mostrar_estadisticas_cache,
+    perfilar_inicio,
+)
 from src.definiciones.constantes import Config
+from src.definiciones.schemas import Extension
+
+
+def leer_argumentos() -> argparse.Namespace:
+    formatos = [e for e in get_args(Extension) if e != ".txt"]
+    parser = argparse.ArgumentParser(description=Config.NOMBRE_APP)
+    parser.add_argument(
+        "--exportar-todos",
+        action="store_true",
+        help="exporta las tareas de todos los usuarios en exportaciones/",
+    )
+    parser.add_argument(
+        "--formatos",
+        nargs="+",
+        choices=formatos,
+        default=[".csv", ".json"],
+        help="formatos de la exportación de todos los usuarios",
+    )
+    parser.add_argument(
+        "--perfil-inicio",
+        "--profile-startup",
+        action="store_true",
+        help="muestra el tiempo de importación de cada módulo al iniciar",
+    )
+    parser.add_argument(
+        "--estadisticas-cache",
+        "--cache-stats",
+        action="store_true",
+        help="muestra los aciertos y fallos de la caché de lectura al salir",
+    )
+    comandos.agregar_subcomandos(parser)
+    return parser.parse_args()
 
 
 def main():
+    argumentos = leer_argumentos()
+    if argumentos.perfil_inicio:
+        perfilar_inicio()
+        return
+    if argumentos.exportar_todos:
+        exportar_todos(tuple(argumentos.formatos))
+        return
+    if argumentos.comando:
+        codigo = comandos.ejecutar(argumentos)
+        if argumentos.estadisticas_cache:
+            mostrar_estadisticas_cache()
+        sys.exit(codigo)
+
     try:
-        menu_acceso()
-    except KeyboardInterrupt:
+        with cli.pantalla_completa():
+            ejecutar()
+    except (KeyboardInterrupt, EOFError):
         pass
     except Exception as e:
         cli.print_error(str(e))
@@ -16,6 +72,8 @@ def main():
             contenido="App finalizada. ¡Hasta pronto! 🤝",
             limpiar=False,
         )
+        if argumentos.estadisticas_cache:
+            mostrar_estadisticas_cache()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,385 @@
+"""
+Modo no interactivo (comandos).
+
+Permite automatizar la gestión de las tareas de un usuario (Ej. desde cron u
+otras herramientas) mediante subcomandos que llaman directamente a los
+servicios:
+
+    python main.py agregar "Pagar cuentas" -c hogar -v 30-06-2025 -u ana
+    python main.py listar --estado pendiente --formato json -u ana
+    python main.py estado finalizada 3 5 -u ana
+    python main.py lote comandos.txt -u ana
+
+La clave se lee desde la variable de entorno TAREAS_CLAVE (o se solicita).
+El subcomando `lote` ejecuta varios comandos (uno por línea, desde un
+archivo o la entrada estándar) con un único inicio de sesión, una única
+carga de tareas y una única escritura al finalizar.
+"""
+
+import argparse
+import os
+import re
+import sys
+from contextlib import nullcontext
+from datetime import date
+from typing import get_args
+
+import src.lib.consola as cli
+import src.servicios as servicios
+import src.utils as utils
+from src.definiciones.schemas import EstadoGlobal, Extension
+
+
+VARIABLE_CLAVE = "TAREAS_CLAVE"
+
+# Estados aceptados por los comandos (en el orden de servicios.ESTADOS)
+OPCIONES_ESTADO = {"pendiente": 1, "proceso": 2, "finalizada": 3}
+
+# Etiquetas de estilo de rich ([blue], [/blue], [/]) en los mensajes
+MARCADO = re.compile(r"\[/?[\w ]*\]")
+
+
+def agregar_subcomandos(parser: argparse.ArgumentParser):
+    """Agrega los subcomandos del modo no interactivo al parser de main.py."""
+    sesion = argparse.ArgumentParser(add_help=False)
+    sesion.add_argument(
+        "-u", "--usuario", required=True, help="nombre de usuario"
+    )
+    subparsers = parser.add_subparsers(dest="comando", metavar="COMANDO")
+    _crear_subcomandos(subparsers, [sesion])
+
+    lote = subparsers.add_parser(
+        "lote",
+        aliases=["batch"],
+        parents=[sesion, _opciones_salida()],
+        help="ejecuta varios comandos (uno por línea) en una sola sesión",
+    )
+    lote.add_argument(
+        "archivo",
+        nargs="?",
+        default="-",
+        help="archivo con los comandos (por defecto, la entrada estándar)",
+    )
+    lote.add_argument(
+        "--detener",
+        action="store_true",
+        help="se detiene en el primer comando con error",
+    )
+    lote.set_defaults(ejecutar=_comando_lote)
+
+
+def ejecutar(argumentos: argparse.Namespace) -> int:
+    """Inicia sesión y ejecuta el subcomando. Retorna el código de salida."""
+    formato = argumentos.formato or "texto"
+    clave = os.environ.get(VARIABLE_CLAVE)
+    if not clave:
+        import getpass
+
+        clave = getpass.getpass("Clave: ")
+    sesion = servicios.login(argumentos.usuario.lower(), clave)
+
+    if isinstance(sesion, str):
+        _mostrar_respuesta(sesion, formato)
+        return 1
+    return 0 if argumentos.ejecutar(sesion, argumentos, formato) else 1
+
+
+def _crear_subcomandos(subparsers, padres: list[argparse.ArgumentParser]):
+    """Crea los subcomandos que operan sobre las tareas de la sesión."""
+    padres = [*padres, _opciones_salida()]
+    formatos = [e for e in get_args(Extension) if e != ".txt"]
+
+    agregar = subparsers.add_parser(
+        "agregar", aliases=["add"], parents=padres, help="agrega una tarea"
+    )
+    agregar.add_argument("titulo", type=_texto, help="título de la tarea")
+    agregar.add_argument("-c", "--categoria", required=True, type=_texto)
+    agregar.add_argument(
+        "-v", "--vence", type=_fecha, help="fecha límite (dd-mm-aaaa)"
+    )
+    agregar.set_defaults(ejecutar=_comando_agregar)
+
+    listar = subparsers.add_parser(
+        "listar", aliases=["list"], parents=padres, help="lista las tareas"
+    )
+    listar.add_argument("-e", "--estado", choices=OPCIONES_ESTADO)
+    listar.add_argument(
+        "-t", "--texto", default="", help="palabras del título"
+    )
+    listar.add_argument(
+        "-c", "--categoria", default="", help="categorías (Ej. python, hogar)"
+    )
+    listar.add_argument(
+        "-o",
+        "--orden",
+        choices=["limite", "creacion"],
+        help="ordena por fecha límite o de creación",
+    )
+    listar.set_defaults(ejecutar=_comando_listar)
+
+    estado = subparsers.add_parser(
+        "estado",
+        aliases=["set-state"],
+        parents=padres,
+        help="cambia el estado de una o varias tareas",
+    )
+    estado.add_argument("estado", choices=OPCIONES_ESTADO)
+    estado.add_argument(
+        "tareas", nargs="+", help="N° (según listar) o id de las tareas"
+    )
+    estado.set_defaults(ejecutar=_comando_estado)
+
+    eliminar = subparsers.add_parser(
+        "eliminar-finalizadas",
+        aliases=["purge-finished"],
+        parents=padres,
+        help="elimina las tareas finalizadas",
+    )
+    eliminar.set_defaults(ejecutar=_comando_eliminar_finalizadas)
+
+    exportar = subparsers.add_parser(
+        "exportar",
+        aliases=["export"],
+        parents=padres,
+        help="exporta las tareas en exportaciones/<carpeta>",
+    )
+    exportar.add_argument("carpeta", type=_texto)
+    exportar.add_argument(
+        "--formatos", nargs="+", choices=formatos, default=[".csv", ".json"]
+    )
+    exportar.add_argument(
+        "--archivadas",
+        action="store_true",
+        help="incluye las tareas archivadas",
+    )
+    exportar.set_defaults(ejecutar=_comando_exportar)
+
+    importar = subparsers.add_parser(
+        "importar",
+        aliases=["import"],
+        parents=padres,
+        help=(
+            "importa tareas desde un archivo .csv, .json o .ndjson "
+            "(opcionalmente comprimido: .csv.gz, .json.gz, .ndjson.gz)"
+        ),
+    )
+    importar.add_argument("archivo")
+    importar.set_defaults(ejecutar=_comando_importar)
+
+
+def _opciones_salida() -> argparse.ArgumentParser:
+    """Opciones comunes a todos los subcomandos."""
+    salida = argparse.ArgumentParser(add_help=False)
+    salida.add_argument(
+        "-f",
+        "--formato",
+        "--format",
+        choices=["texto", "json"],
+        help="formato de la salida (por defecto, texto)",
+    )
+    return salida
+
+
+def _texto(valor: str) -> str:
+    """Valida (argparse) un texto de entre 1 y 50 caracteres."""
+    if not 1 <= len(valor) <= 50:
+        error = "debe contener entre 1 y 50 caracteres"
+        raise argparse.ArgumentTypeError(error)
+    return valor
+
+
+def _fecha(valor: str) -> str:
+    """Valida (argparse) una fecha con formato dd-mm-aaaa."""
+    try:
+        utils.fecha_a_ordinal(valor)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("formato de fecha inválido") from e
+    return valor
+
+
+def _mostrar_respuesta(respuesta: str, formato: str, **datos) -> bool:
+    """
+    Muestra la respuesta de un servicio ("tipo:mensaje"). Retorna False si
+    la respuesta es un error.
+    """
+    tipo, mensaje = respuesta.split(":", 1)
+
+    if formato == "json":
+        texto = MARCADO.sub("", mensaje)
+        cli.print_json({"tipo": tipo, "mensaje": texto, **datos})
+    elif tipo == "error":
+        cli.print_error(mensaje)
+    elif tipo == "info":
+        cli.print_alerta(mensaje)
+    else:
+        cli.print_exito(mensaje)
+    return tipo != "error"
+
+
+def _comando_agregar(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    form = {
+        "titulo": argumentos.titulo,
+        "categoria": argumentos.categoria,
+        "fecha_vencimiento": argumentos.vence or "-",
+    }
+    tareas = sesion["tareas"]
+    respuesta = servicios.crear_tarea(
+        tareas, form, sesion["usuario"], sesion["indice"]
+    )
+    return _mostrar_respuesta(respuesta, formato, tarea=dict(tareas[-1]))
+
+
+def _comando_listar(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    tareas, indice = sesion["tareas"], sesion["indice"]
+
+    # 1) FILTRAR (y opcionalmente ordenar) MEDIANTE EL ÍNDICE
+    posiciones = servicios.buscar_tareas(
+        indice,
+        argumentos.texto,
+        argumentos.categoria,
+        OPCIONES_ESTADO.get(argumentos.estado, 0),
+    )
+    if argumentos.orden:
+        criterio = 1 if argumentos.orden == "limite" else 2
+        filtradas = set(posiciones)
+        posiciones = [
+            p
+            for p in servicios.ordenar_tareas(indice, criterio)
+            if p in filtradas
+        ]
+
+    # 2) MOSTRAR LAS TAREAS
+    if formato == "json":
+        hoy = date.today().toordinal()
+        cli.print_json(
+            [
+                {
+                    "numero": p + 1,
+                    **tareas[p],
+                    "vigencia": None
+                    if tareas[p]["estado"] == "Finalizada"
+                    else utils.clasificar_vigencia(
+                        utils.dias_desde_hoy(fecha, hoy)
+                        if (fecha := tareas[p]["fecha_vencimiento"])
+                        else None
+                    ),
+                }
+                for p in posiciones
+            ]
+        )
+    elif posiciones:
+        columnas, filas = utils.generar_datos_tabla(
+            tareas, posiciones=posiciones
+        )
+        cli.print_tabla("TAREAS", columnas, filas, limpiar=False)
+    else:
+        cli.print_alerta("No se encontraron tareas.")
+    return True
+
+
+def _comando_estado(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    tareas = sesion["tareas"]
+    por_id = {t["id"]: t for t in tareas}
+
+    # 1) OBTENER LAS TAREAS (por N° o id), SIN REPETIR
+    seleccionadas = {}
+    for referencia in argumentos.tareas:
+        if referencia.isdigit() and 1 <= int(referencia) <= len(tareas):
+            tarea = tareas[int(referencia) - 1]
+        elif referencia in por_id:
+            tarea = por_id[referencia]
+        else:
+            error = f"error:No existe la tarea {referencia}."
+            return _mostrar_respuesta(error, formato)
+        seleccionadas[tarea["id"]] = tarea
+
+    # 2) EJECUTAR EL SERVICIO Y MOSTRAR RESPUESTA
+    respuesta = servicios.cambiar_estado_tareas(
+        list(seleccionadas.values()),
+        OPCIONES_ESTADO[argumentos.estado],
+        sesion["indice"],
+    )
+    return _mostrar_respuesta(respuesta, formato)
+
+
+def _comando_eliminar_finalizadas(
+    sesion: EstadoGlobal, argumentos, formato: str
+) -> bool:
+    tareas = sesion["tareas"]
+    if not any(t["estado"] == "Finalizada" for t in tareas):
+        return _mostrar_respuesta("info:No hay tareas finalizadas.", formato)
+
+    respuesta = servicios.eliminar_finalizadas(
+        tareas, sesion["usuario"], sesion["indice"]
+    )
+    return _mostrar_respuesta(respuesta, formato)
+
+
+def _comando_exportar(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    tareas = sesion["tareas"]
+    if argumentos.archivadas:
+        archivadas = servicios.obtener_tareas_archivadas(sesion["usuario"])
+        tareas = [*tareas, *archivadas]
+
+    if not tareas:
+        return _mostrar_respuesta("info:No hay datos para exportar", formato)
+
+    respuesta = servicios.exportar_tareas(
+        tareas, tuple(argumentos.formatos), argumentos.carpeta, False
+    )
+    return _mostrar_respuesta(respuesta, formato)
+
+
+def _comando_importar(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    respuesta = servicios.importar_tareas(
+        sesion["tareas"],
+        argumentos.archivo,
+        sesion["usuario"],
+        sesion["indice"],
+    )
+    return _mostrar_respuesta(respuesta, formato)
+
+
+def _comando_lote(sesion: EstadoGlobal, argumentos, formato: str) -> bool:
+    """
+    Ejecuta los comandos del archivo (o entrada estándar) línea a línea,
+    sobre la misma sesión. Las líneas vacías y los comentarios (#) se
+    omiten, y las modificaciones se guardan en una única escritura.
+    """
+    import shlex
+
+    parser = argparse.ArgumentParser(prog="lote", add_help=False)
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    _crear_subcomandos(subparsers, [])
+
+    exitoso = True
+    if argumentos.archivo == "-":
+        archivo = nullcontext(sys.stdin)
+    else:
+        try:
+            archivo = open(argumentos.archivo, encoding="utf-8")
+        except OSError:
+            error = f"error:No se pudo abrir el archivo {argumentos.archivo}"
+            return _mostrar_respuesta(error, formato)
+
+    unidad = servicios.unidad_de_trabajo(sesion["tareas"], sesion["indice"])
+    with archivo as lineas, unidad:
+        for numero, linea in enumerate(lineas, 1):
+            # argparse muestra el error de uso y finaliza con SystemExit
+            try:
+                palabras = shlex.split(linea, comments=True)
+                if not palabras:
+                    continue
+                comando = parser.parse_args(palabras)
+            except (ValueError, SystemExit):
+                error = f"error:Línea {numero}: comando inválido."
+                _mostrar_respuesta(error, formato)
+                exitoso = False
+            else:
+                formato_linea = comando.formato or formato
+                if not comando.ejecutar(sesion, comando, formato_linea):
+                    exitoso = False
+
+            if not exitoso and argumentos.detener:
+                break
+    return exitoso
@@ -5,16 +5,38 @@ Este módulo actúa como el orquestador principal de la aplicación.
 Gestiona el ciclo de vida de la interacción con el usuario mediante la
 presentación de menús, solicitud de datos, la lógica de navegación entre
 pantallas y la invocación de servicios.
+
+La navegación es una máquina de estados: cada pantalla (menú) es una función
+que retorna la siguiente pantalla a mostrar, y `ejecutar` las recorre en un
+ciclo. De este modo la profundidad de la pila no crece con la duración de la
+sesión, y la sesión puede ser conducida por un guion (entrada estándar).
 """
 
+import time
+from functools import partial
+
 import src.lib.consola as cli
 import src.servicios as servicios
 import src.utils as utils
-from src.definiciones.constantes import Config
-from src.definiciones.schemas import EstadoGlobal, Extension, Form, Menu
+from src.definiciones.constantes import Config, Limites
+from src.definiciones.schemas import (
+    EstadoGlobal,
+    Extension,
+    Form,
+    Menu,
+    Pantalla,
+    Tarea,
+)
+
 
+def ejecutar(pantalla: Pantalla | None = None):
+    """Muestra las pantallas, comenzando por el menú de acceso, hasta salir."""
+    pantalla = pantalla or menu_acceso
+    while pantalla is not None:
+        pantalla = pantalla()
 
-def menu_acceso():
+
+def menu_acceso() -> Pantalla | None:
     bienvenida = f"Bienvenido a [green_yellow]{Config.NOMBRE_APP}[/], el programa N°1 para la Administración de Tareas.\n\n[red]DEMO->Nombre de usuario: demo, Clave: demo123[/red]\n\n"
 
     menu: Menu = {
@@ -29,16 +51,14 @@ def menu_acceso():
 
     match opcion:
         case 1:
-            iniciar_sesion()
+            return iniciar_sesion
         case 2:
-            crear_cuenta()
+            return crear_cuenta
         case 3:
-            return
+            return None
 
-    menu_acceso()
 
-
-def iniciar_sesion():
+def iniciar_sesion() -> Pantalla:
     cli.print_exito("Ingrese sus datos para iniciar sesión.")
     usuario = cli.input_texto("Nombre de usuario", 4, 20).lower()
     clave = cli.input_texto("Ingrese su clave", 1, 20)
@@ -47,13 +67,13 @@ def iniciar_sesion():
 
     if isinstance(respuesta, str):
         cli.print_toast(respuesta)
-        return
+        return menu_acceso
 
     cli.print_toast("ok:Inicio de sesión exitoso.")
-    menu_principal(respuesta)
+    return partial(menu_principal, respuesta)
 
 
-def crear_cuenta():
+def crear_cuenta() -> Pantalla:
     cli.print_exito("Ingrese los siguientes datos para crear una cuenta.")
     usuario = cli.input_texto("Nombre de usuario", 4, 20).lower()
     nombre = cli.input_texto("Ingrese su nombre", 3)
@@ -63,20 +83,26 @@ def crear_cuenta():
 
     if isinstance(respuesta, str):
         cli.print_toast(respuesta)
-        return
+        return menu_acceso
 
     cli.print_toast("ok:Usuario creado exitosamente.")
-    menu_principal(respuesta)
+    return partial(menu_principal, respuesta)
 
 
-def menu_principal(estado: EstadoGlobal):
+def menu_principal(estado: EstadoGlobal) -> Pantalla:
+    resumen = utils.formatear_resumen(
+        servicios.obtener_resumen(estado["indice"])
+    )
     menu: Menu = {
         "titulo": "🔸 MENÚ PRINCIPAL 🔸",
         "opciones": [
-            "📌 1. Agregar tarea",
+            resumen + "📌 1. Agregar tarea",
             "📋 2. Listar tareas",
-            "💾 3. Exportar datos",
-            "🚪 4. Cerrar sesión",
+            "🔍 3. Buscar tareas",
+            "📅 4. Vencimientos y orden",
+            "💾 5. Exportar datos",
+            "🗄️ 6. Ver tareas archivadas",
+            "🚪 7. Cerrar sesión",
         ],
     }
     opcion = utils.obtener_opcion_menu(menu)
@@ -85,14 +111,20 @@ def menu_principal(estado: EstadoGlobal):
         case 1:
             formulario_agregar(estado)
         case 2:
-            listar_tareas(estado)
+            return partial(listar_tareas, estado)
         case 3:
-            exportar_datos(estado)
+            buscar_tareas(estado)
         case 4:
+            menu_vencimientos(estado)
+        case 5:
+            exportar_datos(estado)
+        case 6:
+            listar_archivadas(estado)
+        case 7:
             cli.print_toast("info:Ha cerrado la sesión.")
-            return
+            return menu_acceso
 
-    menu_principal(estado)
+    return partial(menu_principal, estado)
 
 
 def formulario_agregar(estado: EstadoGlobal):
@@ -138,42 +170,153 @@ def formulario_agregar(estado: EstadoGlobal):
 
     # 3) Se arma la tarea iterando cada campo y extrayendo su "nombre" y "valor"
     nueva_tarea = {c["nombre"]: c.get("valor") for c in campos}
-    respuesta = servicios.crear_tarea(tareas, nueva_tarea, usuario)
+    respuesta = servicios.crear_tarea(
+        tareas, nueva_tarea, usuario, estado["indice"]
+    )
 
     cli.print_toast(respuesta, "volver al menú principal")
 
 
-def listar_tareas(estado: EstadoGlobal):
+def listar_tareas(estado: EstadoGlobal, pagina: int = 1) -> Pantalla:
     tareas = estado["tareas"]
+    volver = partial(menu_principal, estado)
 
     # 1) SI NO HAY TAREAS -> se muestra mensaje y regresa al menú
     if not tareas:
         cli.print_toast("info:No hay tareas registradas.", "volver al menú")
-        return
+        return volver
 
-    # 2) SI HAY TAREAS -> se muestran en una tabla
-    columnas, filas = utils.generar_datos_tabla(tareas)
-    cli.print_tabla("LISTA DE TAREAS", columnas, filas)
+    # 2) SI HAY TAREAS -> se muestran en una tabla (por páginas)
+    pagina = mostrar_tareas(tareas, "LISTA DE TAREAS", pagina)
 
     # 3) SI NO DESEA HACER MODIFICACIONES -> se vuelve al menú
     modificar = cli.input_confirmar("¿Desea realizar una modificación?")
     if not modificar:
-        return
+        return volver
 
     # 4) SI DESEA HACER MODIFICACIONES -> se muestra el menú para modificar
     menu_modificar(estado)
 
     # 5) AL TERMINAR DE MODIFICAR -> se vuelve a mostrar el listado
-    listar_tareas(estado)
+    return partial(listar_tareas, estado, pagina)
+
+
+def mostrar_tareas(
+    tareas: list[Tarea],
+    titulo: str,
+    pagina: int = 1,
+    destacar_finalizadas: bool = False,
+    caption: str | None = None,
+    posiciones: list[int] | None = None,
+) -> int:
+    """
+    Muestra las tareas en una tabla por páginas, permitiendo avanzar,
+    retroceder o ir a una página. Solo se generan las filas de la página
+    visible, y cada tarea conserva su ID global. Si se indican `posiciones`,
+    solo se muestran esas tareas. Retorna la última página mostrada.
+    """
+    por_pagina = Limites.TAREAS_POR_PAGINA
+    cantidad = len(tareas) if posiciones is None else len(posiciones)
+    paginas = max(1, -(-cantidad // por_pagina))
+
+    while True:
+        pagina = min(pagina, paginas)
+        inicio = (pagina - 1) * por_pagina
+        columnas, filas = utils.generar_datos_tabla(
+            tareas, destacar_finalizadas, inicio, por_pagina, posiciones
+        )
+        texto_pagina = f"Página {pagina} de {paginas} ({cantidad} tareas)"
+        textos = [caption, texto_pagina if paginas > 1 else None]
+        texto = "\n".join(t for t in textos if t) or None
+        cli.print_tabla(titulo, columnas, filas, texto)
+
+        if paginas == 1:
+            return pagina
+        nueva_pagina = cli.input_pagina(pagina, paginas)
+        if nueva_pagina is None:
+            return pagina
+        pagina = nueva_pagina
+
+
+def buscar_tareas(estado: EstadoGlobal):
+    tareas = estado["tareas"]
+
+    # 1) SI NO HAY TAREAS -> se muestra mensaje y regresa al menú
+    if not tareas:
+        cli.print_toast("info:No hay tareas registradas.", "volver al menú")
+        return
+
+    # 2) SE SOLICITAN LOS FILTROS (VACÍO = SIN FILTRO)
+    cli.print_panel("BUSCAR TAREAS", "Presione ENTER para omitir un filtro.")
+    texto_estado = "Estado 0=Todos 1=Pendiente 2=En proceso 3=Finalizada"
+    texto = cli.input_texto("Palabras del título", min_len=0)
+    categoria = cli.input_texto("Categorías (Ej. python, hogar)", min_len=0)
+    numero_estado = cli.input_entero(texto_estado, min=0, max=3)
+
+    # 3) SE BUSCA EN EL ÍNDICE (NO SE RECORRE EL LISTADO)
+    posiciones = servicios.buscar_tareas(
+        estado["indice"], texto, categoria, numero_estado
+    )
+    if not posiciones:
+        cli.print_toast("info:No se encontraron tareas.", "volver al menú")
+        return
+
+    # 4) SE MUESTRAN LOS RESULTADOS (CON EL ID DEL LISTADO)
+    mostrar_tareas(tareas, "RESULTADOS DE BÚSQUEDA", posiciones=posiciones)
+    cli.input_continuar("volver al menú")
+
+
+def menu_vencimientos(estado: EstadoGlobal):
+    tareas, indice = estado["tareas"], estado["indice"]
+
+    # 1) SI NO HAY TAREAS -> se muestra mensaje y regresa al menú
+    if not tareas:
+        cli.print_toast("info:No hay tareas registradas.", "volver al menú")
+        return
+
+    # 2) SE SOLICITA LA VISTA
+    menu: Menu = {
+        "titulo": "📅 VENCIMIENTOS Y ORDEN 📅",
+        "opciones": [
+            "🔸 1. Tareas atrasadas",
+            "🔸 2. Tareas que vencen hoy",
+            "🔸 3. Tareas que vencen en los próximos días",
+            "🔸 4. Ordenar por fecha límite",
+            "🔸 5. Ordenar por fecha de creación",
+            "🔸 6. Volver",
+        ],
+    }
+    opcion = utils.obtener_opcion_menu(menu)
+
+    # 3) SE OBTIENEN LAS TAREAS DESDE EL ÍNDICE DE FECHAS (SIN RECORRER TODO)
+    match opcion:
+        case 1 | 2:
+            posiciones = servicios.filtrar_por_vencimiento(indice, opcion)
+        case 3:
+            dias = cli.input_entero("Cantidad de días", min=0)
+            posiciones = servicios.filtrar_por_vencimiento(indice, 3, dias)
+        case 4 | 5:
+            posiciones = servicios.ordenar_tareas(indice, opcion - 3)
+        case 6:
+            return
+
+    # 4) SE MUESTRAN LAS TAREAS (CON EL ID DEL LISTADO)
+    if not posiciones:
+        cli.print_toast("info:No hay tareas en esta vista.", "volver al menú")
+        return
+    titulo = menu["opciones"][opcion - 1].removeprefix(f"🔸 {opcion}. ")
+    mostrar_tareas(tareas, titulo.upper(), posiciones=posiciones)
+    cli.input_continuar("volver al menú")
 
 
 def menu_modificar(estado: EstadoGlobal):
     menu: Menu = {
         "titulo": "📝 MODIFICAR TAREAS 📝",
         "opciones": [
-            "🔸 1. Cambiar estado de tarea",
+            "🔸 1. Cambiar estado de tarea(s)",
             "🔸 2. Eliminar tareas finalizadas",
-            "🔸 3. Cancelar",
+            "🔸 3. Archivar tareas",
+            "🔸 4. Cancelar",
         ],
     }
     opcion = utils.obtener_opcion_menu(menu)
@@ -184,27 +327,30 @@ def menu_modificar(estado: EstadoGlobal):
         case 2:
             eliminar_finalizadas(estado)
         case 3:
+            archivar(estado)
+        case 4:
             return
 
 
 def cambiar_estado(estado: EstadoGlobal):
     tareas = estado["tareas"]
 
-    # 1) LISTAR TAREAS
-    columnas, filas = utils.generar_datos_tabla(tareas)
-    cli.print_tabla("LISTA DE TAREAS", columnas, filas)
+    # 1) LISTAR TAREAS (LOS ID SON GLOBALES, NO DEPENDEN DE LA PÁGINA)
+    mostrar_tareas(tareas, "LISTA DE TAREAS")
 
-    # 2) SE SOLICITA EL PSEUDO ID (ÍNDICE) DE LA TAREA Y EL NUEVO ESTADO
-    texto_id = "ID de la tarea a modificar"
+    # 2) SE SOLICITAN LOS PSEUDO ID (ÍNDICES) DE LAS TAREAS Y EL NUEVO ESTADO
+    texto_id = "ID de las tareas a modificar (Ej. 1,3,5-8)"
     texto_estado = "N° del nuevo estado 1=Pendiente 2=En proceso 3=Finalizada"
-    indice_tarea = cli.input_entero(texto_id, min=1, max=len(tareas)) - 1
+    indices = cli.input_indices(texto_id, max=len(tareas))
     nuevo_estado = cli.input_entero(texto_estado, min=1, max=3)
 
-    # 3) MEDIANTE EL ÍNDICE SE OBTIENE LA TAREA (LA CUAL CONTIENE EL ID REAL)
-    tarea = tareas[indice_tarea]
+    # 3) MEDIANTE LOS ÍNDICES SE OBTIENEN LAS TAREAS (CONTIENEN EL ID REAL)
+    seleccionadas = [tareas[indice - 1] for indice in indices]
 
-    # 4) SE EJECUTA EL SERVICIO Y SE MUESTRA EL RESULTADO
-    respuesta = servicios.cambiar_estado_tarea(tareas, tarea, nuevo_estado)
+    # 4) SE EJECUTA EL SERVICIO (UNA ESCRITURA) Y SE MUESTRA EL RESULTADO
+    respuesta = servicios.cambiar_estado_tareas(
+        seleccionadas, nuevo_estado, estado["indice"]
+    )
     cli.print_toast(respuesta)
 
 
@@ -218,11 +364,10 @@ def eliminar_finalizadas(estado: EstadoGlobal):
         return
 
     # 2) SI HAY TAREAS FINALIZADAS -> se listan, destacando las que serán eliminadas
-    columnas, filas = utils.generar_datos_tabla(tareas, True)
-    cli.print_tabla(
+    mostrar_tareas(
+        tareas,
         titulo="LISTA DE TAREAS",
-        columnas=columnas,
-        filas=filas,
+        destacar_finalizadas=True,
         caption="[black on red bold]Tareas a eliminar[/]",
     )
 
@@ -233,10 +378,46 @@ def eliminar_finalizadas(estado: EstadoGlobal):
         return
 
     # 4) SI CONFIRMA LA ELIMINACIÓN -> se muestra el resultado
-    respuesta = servicios.eliminar_finalizadas(tareas, usuario)
+    respuesta = servicios.eliminar_finalizadas(
+        tareas, usuario, estado["indice"]
+    )
+    cli.print_toast(respuesta, "volver al listado")
+
+
+def archivar(estado: EstadoGlobal):
+    tareas, usuario = estado["tareas"], estado["usuario"]
+
+    # 1) SE SOLICITA EL CRITERIO DE LAS TAREAS A ARCHIVAR
+    texto_criterio = "Archivar 1=Tareas finalizadas 2=Tareas antiguas"
+    texto_dias = "Archivar tareas creadas hace más de (días)"
+    criterio = cli.input_entero(texto_criterio, min=1, max=2)
+    dias = cli.input_entero(texto_dias, min=0) if criterio == 2 else None
+
+    # 2) SI NO CONFIRMA -> se cancela la operación
+    if not cli.input_confirmar("¿Confirma el archivado?"):
+        cli.print_toast("info:Operación cancelada.", "volver al listado")
+        return
+
+    # 3) SE EJECUTA EL SERVICIO Y SE MUESTRA EL RESULTADO
+    respuesta = servicios.archivar_tareas(
+        tareas, usuario, dias, estado["indice"]
+    )
     cli.print_toast(respuesta, "volver al listado")
 
 
+def listar_archivadas(estado: EstadoGlobal):
+    archivadas = servicios.obtener_tareas_archivadas(estado["usuario"])
+
+    # 1) SI NO HAY TAREAS ARCHIVADAS -> se muestra mensaje y regresa al menú
+    if not archivadas:
+        cli.print_toast("info:No hay tareas archivadas.", "volver al menú")
+        return
+
+    # 2) SI HAY TAREAS ARCHIVADAS -> se muestran en una tabla (solo lectura)
+    mostrar_tareas(archivadas, "TAREAS ARCHIVADAS")
+    cli.input_continuar("volver al menú")
+
+
 def exportar_datos(estado: EstadoGlobal):
     tareas = estado["tareas"]
 
@@ -248,7 +429,14 @@ def exportar_datos(estado: EstadoGlobal):
     # 2) SI HAY TAREAS -> solicitar tipo de archivos a exportar
     cli.print_panel("EXPORTAR DATOS", "Complete la siguiente información.")
 
-    extensiones: tuple[Extension, ...] = (".csv", ".json", ".html")
+    extensiones: tuple[Extension, ...] = (
+        ".csv",
+        ".json",
+        ".html",
+        ".ndjson",
+        ".csv.gz",
+        ".ndjson.gz",
+    )
     extensiones_incluidas: tuple[Extension, ...] = tuple(
         opcion
         for indice, opcion in enumerate(extensiones, 1)
@@ -256,6 +444,12 @@ def exportar_datos(estado: EstadoGlobal):
             f"({indice}/{len(extensiones)}) ¿Desea incluir [green]{opcion}[/green]?"
         )
     )
+    incluir_archivadas = cli.input_confirmar(
+        "¿Desea incluir las tareas archivadas?"
+    )
+    if incluir_archivadas:
+        archivadas = servicios.obtener_tareas_archivadas(estado["usuario"])
+        tareas = [*tareas, *archivadas]
     carpeta = cli.input_texto("Nombre de la carpeta de destino")
 
     abrir = False
@@ -267,3 +461,64 @@ def exportar_datos(estado: EstadoGlobal):
         tareas, extensiones_incluidas, carpeta, abrir
     )
     cli.print_toast(respuesta, "volver al menú principal")
+
+
+def exportar_todos(extensiones: tuple[Extension, ...]):
+    """Exporta las tareas de todos los usuarios (uso administrativo)."""
+    inicio = time.perf_counter()
+    filas = [
+        [nombre_usuario, str(cantidad), f"{segundos:.2f} s"]
+        for nombre_usuario, cantidad, segundos in servicios.exportar_todos(
+            extensiones
+        )
+    ]
+    total = time.perf_counter() - inicio
+
+    titulo = "EXPORTACIÓN DE TODOS LOS USUARIOS"
+    columnas = ["Usuario", "Tareas", "Tiempo"]
+    resumen = f"{len(filas)} usuarios exportados en {total:.2f} s"
+    cli.print_tabla(titulo, columnas, filas, resumen)
+
+
+def perfilar_inicio(cantidad: int = 20):
+    """
+    Muestra el tiempo de importación de los módulos cargados al iniciar la
+    aplicación (import main), para detectar regresiones en el inicio.
+    """
+    import src.lib.perfil as perfil
+
+    tiempos = perfil.perfilar_importacion("main")
+    total = next(t[2] for t in tiempos if t[0] == "main")
+
+    titulo = "TIEMPO DE INICIO (IMPORTACIÓN DE MÓDULOS)"
+    columnas = ["Módulo", "Propio", "Acumulado"]
+    filas = [
+        [nombre, f"{propio / 1000:.1f} ms", f"{acumulado / 1000:.1f} ms"]
+        for nombre, propio, acumulado in tiempos[:cantidad]
+    ]
+    resumen = f"{len(tiempos)} módulos importados en {total / 1000:.1f} ms"
+    cli.print_tabla(titulo, columnas, filas, resumen, limpiar=False)
+
+
+def mostrar_estadisticas_cache():
+    """
+    Muestra los aciertos y fallos de la caché de lectura de archivos durante
+    la ejecución, para comprobar cuántas lecturas evita.
+    """
+    import src.lib.archivos as gestor
+
+    estadisticas = gestor.estadisticas_cache()
+    lecturas = estadisticas["aciertos"] + estadisticas["fallos"]
+    porcentaje = 100 * estadisticas["aciertos"] / lecturas if lecturas else 0
+
+    titulo = "CACHÉ DE LECTURA DE ARCHIVOS"
+    columnas = ["Aciertos", "Fallos", "Entradas"]
+    filas = [
+        [
+            str(estadisticas["aciertos"]),
+            str(estadisticas["fallos"]),
+            str(estadisticas["entradas"]),
+        ]
+    ]
+    resumen = f"{porcentaje:.0f} % de {lecturas} lecturas desde la caché"
+    cli.print_tabla(titulo, columnas, filas, resumen, limpiar=False)
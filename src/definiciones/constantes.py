@@ -5,12 +5,17 @@ Define enumeraciones estáticas utilizadas para mantener la consistencia
 en toda la aplicación (rutas, configuraciones, etc).
 """
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class Rutas(StrEnum):
     USUARIOS = "datos/usuarios.csv"
     TAREAS = "datos/tareas.json"
+    TAREAS_BINARIO = "datos/tareas.bin"
+    DIARIO_TAREAS = "datos/tareas.diario.jsonl"
+    TAREAS_FRAGMENTOS = "datos/tareas/"
+    ARCHIVO_TAREAS = "datos/archivo/"
+    BASE_DATOS = "datos/tareapp.db"
     EXPORTACIONES = "exportaciones/"
     PLANTILLA = "src/plantilla/index.html"
     FAVICON = "src/plantilla/favicon.ico"
@@ -18,3 +23,21 @@ class Rutas(StrEnum):
 
 class Config(StrEnum):
     NOMBRE_APP = "tareApp"
+    # Motor de almacenamiento: "archivo" (CSV + JSON), "fragmentado"
+    # (un JSON de tareas por usuario) o "sqlite"
+    MOTOR_DATOS = "archivo"
+    # Formato de la instantánea de tareas del motor "archivo": "json" o
+    # "binario" (compacto, ver archivos.guardar_tareas_binario). Al cambiarlo,
+    # la siguiente modificación migra la instantánea al nuevo formato
+    FORMATO_TAREAS = "json"
+
+
+class Limites(IntEnum):
+    # Tamaño (bytes) a partir del cual el diario se compacta en tareas.json
+    DIARIO_MAX_BYTES = 1_048_576
+    # Intentos al guardar un archivo modificado en paralelo por otro proceso
+    REINTENTOS_ESCRITURA = 20
+    # Tareas por archivo de datos (bloque) en la exportación web
+    TAREAS_POR_BLOQUE = 1000
+    # Tareas por página al listar tareas en consola
+    TAREAS_POR_PAGINA = 20
@@ -5,13 +5,24 @@ Este módulo define la forma de los objetos de datos para asegurar la
 consistencia y facilitar el autocompletado.
 """
 
-from collections.abc import Callable
-from typing import Literal, NotRequired, TypedDict
+import sys
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
+
+
+if TYPE_CHECKING:
+    from src.indices import IndiceTareas
 
 
 EstadoTarea = Literal["Pendiente", "En proceso", "Finalizada"]
 
-Extension = Literal[".txt", ".csv", ".json", ".html"]
+Vigencia = Literal[
+    "Atrasada", "Vence hoy", "Vence pronto", "A tiempo", "Sin fecha límite"
+]
+
+Extension = Literal[
+    ".txt", ".csv", ".json", ".html", ".ndjson", ".csv.gz", ".ndjson.gz"
+]
 
 
 class Menu(TypedDict):
@@ -49,6 +60,83 @@ class Tarea(TypedDict):
     estado: EstadoTarea
 
 
+CAMPOS_TAREA = tuple(Tarea.__annotations__)
+
+# Campos cuyos valores se repiten entre tareas y por lo tanto se internan
+CAMPOS_INTERNADOS = frozenset(
+    (
+        "id_usuario",
+        "fecha_creacion",
+        "fecha_vencimiento",
+        "categoria",
+        "estado",
+    )
+)
+
+
+class TareaCompacta(MutableMapping):
+    """
+    Representación en memoria de una Tarea que ocupa menos espacio que un
+    diccionario: guarda los campos en __slots__ (sin diccionario por
+    instancia) e interna los textos repetidos entre tareas (usuario, fechas,
+    categoría y estado). Se utiliza igual que un diccionario Tarea
+    (t["estado"], t.keys(), {**t}, dict(t)).
+    """
+
+    __slots__ = CAMPOS_TAREA
+
+    def __init__(self, tarea: Tarea):
+        for campo in CAMPOS_TAREA:
+            self[campo] = tarea[campo]
+
+    def __getitem__(self, campo: str) -> Any:
+        if campo not in CAMPOS_TAREA:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def __setitem__(self, campo: str, valor: Any):
+        if campo not in CAMPOS_TAREA:
+            raise KeyError(campo)
+        if campo in CAMPOS_INTERNADOS and isinstance(valor, str):
+            valor = sys.intern(valor)
+        setattr(self, campo, valor)
+
+    def __delitem__(self, campo: str):
+        raise TypeError("Los campos de una tarea no se pueden eliminar.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CAMPOS_TAREA)
+
+    def __len__(self) -> int:
+        return len(CAMPOS_TAREA)
+
+    def __repr__(self) -> str:
+        return f"TareaCompacta({dict(self)!r})"
+
+    def __reduce__(self):
+        return (TareaCompacta, (dict(self),))
+
+
+class OperacionTarea(TypedDict):
+    op: Literal["crear", "estado", "eliminar", "eliminar_finalizadas"]
+    tarea: NotRequired[Tarea]
+    ids: NotRequired[list[str]]
+    estado: NotRequired[EstadoTarea]
+    id_usuario: NotRequired[str]
+
+
+class Resumen(TypedDict):
+    estados: dict[EstadoTarea, int]
+    vigencias: dict[Vigencia, int]
+    categorias: dict[str, int]
+
+
 class EstadoGlobal(TypedDict):
     usuario: Usuario
-    tareas: list[Tarea]
+    tareas: list[TareaCompacta]
+    indice: "IndiceTareas"
+
+
+# Pantalla del controlador: al ejecutarse retorna la siguiente pantalla (o
+# None para finalizar la aplicación)
+Pantalla = Callable[[], "Pantalla | None"]
@@ -0,0 +1,335 @@
+"""
+Índices de búsqueda de tareas (en memoria, por sesión).
+
+Mantiene un índice invertido (token -> ids de tareas) sobre las palabras del
+título y las categorías de cada tarea, junto con un índice por estado. Los
+tokens se normalizan (minúsculas y sin tildes), por lo que "Programación"
+coincide con "programacion". También mantiene las fechas límite y de
+creación como listas ordenadas de ordinales, por lo que los rangos de fechas
+(Ej. tareas atrasadas) se obtienen mediante búsqueda binaria (bisect).
+Además, mantiene los contadores del resumen de tareas (por estado, categoría
+y vigencia). El índice se construye al iniciar sesión y se actualiza de
+forma incremental con cada modificación, por lo que las búsquedas y el
+resumen no recorren el listado de tareas.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from datetime import date
+from functools import cache, lru_cache
+from typing import Literal, get_args
+
+import src.utils as utils
+from src.definiciones.schemas import EstadoTarea, Resumen, Tarea, Vigencia
+
+
+# Entrada de un índice de fechas: (ordinal, secuencia, id de la tarea). La
+# secuencia respeta el orden del listado entre tareas con la misma fecha.
+ClaveFecha = tuple[int, int, str]
+
+
+PATRON_PALABRA = re.compile(r"\w+")
+
+
+def normalizar(texto: str) -> str:
+    """Convierte un texto a minúsculas y sin tildes (Ej. Ñandú -> nandu)."""
+    if texto.isascii():
+        return texto.casefold()
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(
+        c for c in descompuesto if not unicodedata.combining(c)
+    ).casefold()
+
+
+def tokenizar(texto: str) -> list[str]:
+    """Separa un texto en palabras normalizadas."""
+    return [_normalizar_palabra(p) for p in PATRON_PALABRA.findall(texto)]
+
+
+@lru_cache(maxsize=1 << 16)
+def _normalizar_palabra(palabra: str) -> str:
+    """Normaliza una palabra (memorizada, ya que las palabras se repiten)."""
+    return normalizar(palabra)
+
+
+@cache
+def separar_categorias(categoria: str) -> tuple[str, ...]:
+    """
+    Separa (y normaliza) las categorías de una tarea: "a, b" -> (a, b). Se
+    memoriza por texto, ya que las tareas suelen repetir sus categorías.
+    """
+    return tuple(c for c, _ in _nombres_categorias(categoria))
+
+
+@cache
+def _nombres_categorias(categoria: str) -> tuple[tuple[str, str], ...]:
+    """Pares (categoría normalizada, categoría como fue escrita)."""
+    nombres = (c.strip() for c in categoria.split(","))
+    return tuple((normalizar(n), n) for n in nombres if n)
+
+
+class IndiceTareas:
+    """
+    Índice invertido de las tareas de la sesión. Las posiciones de cada
+    tarea en el listado se mantienen para retornar los resultados en el
+    mismo orden (y con el mismo ID) que muestra el listado.
+    """
+
+    def __init__(self, tareas: Iterable[Tarea] = ()):
+        self.palabras: dict[str, set[str]] = {}
+        self.categorias: dict[str, set[str]] = defaultdict(set)
+        self.estados: dict[str, set[str]] = defaultdict(set)
+        self.posiciones: dict[str, int] = {}
+        self.vencimientos: list[ClaveFecha] = []
+        self.creaciones: list[ClaveFecha] = []
+        # Nombre (como fue escrito) de cada categoría normalizada
+        self.nombres_categorias: dict[str, str] = {}
+        # Tareas no finalizadas por vigencia, calculadas para el día _hoy
+        self.vigencias: Counter[Vigencia] = Counter()
+        self._hoy = date.today().toordinal()
+        # Palabras ordenadas (para buscar por prefijo), se regenera al cambiar
+        self._vocabulario: list[str] | None = None
+        self._secuencia = 0
+
+        # Las fechas se ordenan una única vez al final (no tarea por tarea)
+        for tarea in tareas:
+            for fechas, clave in self._indexar(tarea):
+                fechas.append(clave)
+        self.vencimientos.sort()
+        self.creaciones.sort()
+
+    def reconstruir(self, tareas: Iterable[Tarea]):
+        """
+        Vuelve a construir el índice desde el listado (Ej. al revertir las
+        modificaciones de una unidad de trabajo que no se pudo guardar).
+        """
+        self.__init__(tareas)
+
+    def agregar(self, tarea: Tarea):
+        """Indexa una tarea agregada al final del listado."""
+        self._revisar_dia()
+        for fechas, clave in self._indexar(tarea):
+            insort(fechas, clave)
+
+    def _indexar(self, tarea: Tarea) -> list[tuple[list, ClaveFecha]]:
+        """
+        Indexa las palabras, categorías y estado de una tarea, y retorna las
+        claves que deben agregarse a cada índice de fechas.
+        """
+        id_tarea = tarea["id"]
+        self.posiciones[id_tarea] = len(self.posiciones)
+        self._secuencia += 1
+
+        palabras = self.palabras
+        for palabra in tokenizar(tarea["titulo"]):
+            ids = palabras.get(palabra)
+            if ids is None:
+                palabras[palabra] = ids = set()
+                self._vocabulario = None
+            ids.add(id_tarea)
+        for categoria, nombre in _nombres_categorias(tarea["categoria"]):
+            self.categorias[categoria].add(id_tarea)
+            self.nombres_categorias.setdefault(categoria, nombre)
+        self.estados[tarea["estado"]].add(id_tarea)
+        if tarea["estado"] != "Finalizada":
+            self.vigencias[self._vigencia(tarea)] += 1
+
+        creacion = utils.fecha_a_ordinal(tarea["fecha_creacion"])
+        claves = [(self.creaciones, (creacion, self._secuencia, id_tarea))]
+        if tarea["fecha_vencimiento"] is not None:
+            vencimiento = utils.fecha_a_ordinal(tarea["fecha_vencimiento"])
+            clave = (vencimiento, self._secuencia, id_tarea)
+            claves.append((self.vencimientos, clave))
+        return claves
+
+    def cambiar_estado(self, tarea: Tarea, estado_anterior: EstadoTarea):
+        """Actualiza el índice de estados de una tarea ya modificada."""
+        self._revisar_dia()
+        self.estados[estado_anterior].discard(tarea["id"])
+        self.estados[tarea["estado"]].add(tarea["id"])
+
+        # Las tareas finalizadas no se cuentan en el resumen de vigencia
+        if estado_anterior == "Finalizada":
+            self.vigencias[self._vigencia(tarea)] += 1
+        if tarea["estado"] == "Finalizada":
+            self.vigencias[self._vigencia(tarea)] -= 1
+
+    def quitar(self, quitadas: Iterable[Tarea], restantes: list[Tarea]):
+        """
+        Quita tareas del índice. Las posiciones (y los índices de fechas) se
+        recalculan en una pasada a partir del listado restante, ya que las
+        tareas siguientes cambian de posición.
+        """
+        self._revisar_dia()
+        ids_quitados = set()
+        for tarea in quitadas:
+            id_tarea = tarea["id"]
+            ids_quitados.add(id_tarea)
+            for palabra in tokenizar(tarea["titulo"]):
+                self._descartar(self.palabras, palabra, id_tarea)
+            for categoria in separar_categorias(tarea["categoria"]):
+                self._descartar(self.categorias, categoria, id_tarea)
+            self.estados[tarea["estado"]].discard(id_tarea)
+            if tarea["estado"] != "Finalizada":
+                self.vigencias[self._vigencia(tarea)] -= 1
+
+        self.posiciones = {t["id"]: i for i, t in enumerate(restantes)}
+        self.vencimientos = [
+            c for c in self.vencimientos if c[2] not in ids_quitados
+        ]
+        self.creaciones = [
+            c for c in self.creaciones if c[2] not in ids_quitados
+        ]
+
+    def buscar(
+        self,
+        texto: str = "",
+        categoria: str = "",
+        estado: EstadoTarea | None = None,
+    ) -> list[int]:
+        """
+        Retorna (ordenadas) las posiciones de las tareas que contienen todas
+        las palabras indicadas (o palabras que comienzan con ellas) en el
+        título, todas las categorías indicadas (separadas por coma) y el
+        estado indicado. Los filtros vacíos se omiten.
+        """
+        conjuntos = [self._buscar_prefijo(p) for p in tokenizar(texto)]
+        conjuntos += [
+            self.categorias.get(c, set())
+            for c in separar_categorias(categoria)
+        ]
+        if estado is not None:
+            conjuntos.append(self.estados.get(estado, set()))
+
+        if not conjuntos:
+            return list(range(len(self.posiciones)))
+
+        # Se intersecta comenzando por el conjunto más pequeño
+        conjuntos.sort(key=len)
+        ids = set(conjuntos[0]).intersection(*conjuntos[1:])
+        return sorted(self.posiciones[i] for i in ids)
+
+    def por_vencimiento(
+        self, desde: int | None = None, hasta: int | None = None
+    ) -> list[int]:
+        """
+        Retorna las posiciones de las tareas no finalizadas cuya fecha límite
+        (ordinal) está entre `desde` y `hasta` (inclusive), ordenadas por
+        fecha límite. El rango se obtiene mediante búsqueda binaria.
+        """
+        fechas = self.vencimientos
+        inicio = 0 if desde is None else bisect_left(fechas, (desde,))
+        fin = len(fechas)
+        if hasta is not None:
+            fin = bisect_left(fechas, (hasta + 1,))
+        finalizadas = self.estados.get("Finalizada", set())
+        return [
+            self.posiciones[id_tarea]
+            for _, _, id_tarea in fechas[inicio:fin]
+            if id_tarea not in finalizadas
+        ]
+
+    def ordenadas_por(
+        self, campo: Literal["fecha_vencimiento", "fecha_creacion"]
+    ) -> list[int]:
+        """
+        Retorna las posiciones de todas las tareas ordenadas por la fecha
+        indicada (las tareas sin fecha límite quedan al final).
+        """
+        if campo == "fecha_creacion":
+            return [self.posiciones[c[2]] for c in self.creaciones]
+
+        ordenadas = [self.posiciones[c[2]] for c in self.vencimientos]
+        con_fecha = {c[2] for c in self.vencimientos}
+        ordenadas += [
+            posicion
+            for id_tarea, posicion in self.posiciones.items()
+            if id_tarea not in con_fecha
+        ]
+        return ordenadas
+
+    def resumen(self, cantidad_categorias: int = 5) -> Resumen:
+        """
+        Retorna los conteos de tareas por estado, por vigencia (solo tareas
+        no finalizadas) y de las categorías más frecuentes. Los conteos se
+        mantienen con cada modificación, por lo que no se recorre el listado
+        (salvo las vigencias, que se recalculan una vez al cambiar el día).
+        """
+        self._revisar_dia()
+        estados: dict[EstadoTarea, int] = {
+            e: len(self.estados.get(e, ())) for e in get_args(EstadoTarea)
+        }
+        vigencias = {v: self.vigencias[v] for v in get_args(Vigencia)}
+        frecuentes = heapq.nlargest(
+            cantidad_categorias,
+            self.categorias.items(),
+            key=lambda par: len(par[1]),
+        )
+        categorias = {
+            self.nombres_categorias[c]: len(ids) for c, ids in frecuentes
+        }
+        return {
+            "estados": estados,
+            "vigencias": vigencias,
+            "categorias": categorias,
+        }
+
+    def _vigencia(self, tarea: Tarea) -> Vigencia:
+        """Vigencia de una tarea (respecto del día de los conteos)."""
+        if tarea["fecha_vencimiento"] is None:
+            return utils.clasificar_vigencia(None)
+        vencimiento = utils.fecha_a_ordinal(tarea["fecha_vencimiento"])
+        return utils.clasificar_vigencia(vencimiento - self._hoy)
+
+    def _revisar_dia(self):
+        """
+        Si cambió el día, recalcula los conteos por vigencia a partir del
+        índice de fechas límite (las tareas sin fecha no cambian).
+        """
+        hoy = date.today().toordinal()
+        if hoy == self._hoy:
+            return
+
+        self._hoy = hoy
+        finalizadas = self.estados.get("Finalizada", set())
+        sin_fecha = utils.clasificar_vigencia(None)
+        vigencias = Counter(
+            utils.clasificar_vigencia(vencimiento - hoy)
+            for vencimiento, _, id_tarea in self.vencimientos
+            if id_tarea not in finalizadas
+        )
+        vigencias[sin_fecha] = self.vigencias[sin_fecha]
+        self.vigencias = vigencias
+
+    def _buscar_prefijo(self, prefijo: str) -> set[str]:
+        """Ids de las tareas con alguna palabra que comienza con el prefijo."""
+        if self._vocabulario is None:
+            self._vocabulario = sorted(self.palabras)
+
+        vocabulario = self._vocabulario
+        ids: set[str] = set()
+        posicion = bisect_left(vocabulario, prefijo)
+        while posicion < len(vocabulario):
+            palabra = vocabulario[posicion]
+            if not palabra.startswith(prefijo):
+                break
+            ids |= self.palabras[palabra]
+            posicion += 1
+        return ids
+
+    def _descartar(
+        self, indice: dict[str, set[str]], token: str, id_tarea: str
+    ):
+        """Quita una tarea de un token, eliminando los tokens sin tareas."""
+        ids = indice.get(token)
+        if ids is None:
+            return
+        ids.discard(id_tarea)
+        if not ids:
+            del indice[token]
+            if indice is self.palabras:
+                self._vocabulario = None
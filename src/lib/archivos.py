@@ -2,14 +2,135 @@
 Módulo para la Administración de Archivos.
 
 Centraliza todas las operaciones de manejo de archivos y directorios,
-tales como lectura y escritura de CSV y JSON, creación de directorios, y
-la copia de archivos de un directorio a otro.
+tales como lectura y escritura de CSV, JSON y JSON Lines (opcionalmente
+comprimidos con gzip), creación de directorios, y la copia de archivos de un
+directorio a otro. También incluye un formato binario compacto (opcional)
+para almacenar tareas.
+
+Incluye una caché en memoria para el contenido ya interpretado de los
+archivos, la cual se revalida con os.stat (inodo + mtime_ns + tamaño) y solo
+vuelve a leer el archivo cuando este cambió en disco.
+
+Para permitir varios procesos sobre los mismos archivos, las escrituras se
+realizan bajo un bloqueo entre procesos (fcntl) y los archivos se reemplazan
+de forma atómica (archivo temporal + os.replace). La firma de un archivo
+funciona además como versión (ETag): `guardar_json` puede recibir la versión
+leída y falla con ConflictoVersion si otro proceso modificó el archivo.
+
+Los módulos que solo requieren algunas operaciones (csv, gzip, mmap,
+tempfile) se importan dentro de las funciones que los utilizan.
 """
 
-import csv
 import json
+import os
+import struct
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import date
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, get_args
+
+from src.definiciones.schemas import EstadoTarea, Tarea
+
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo entre procesos
+    fcntl = None
+
+
+# (inodo, mtime_ns, tamaño) de un archivo. (0, 0, 0) si no existe
+Firma = tuple[int, int, int]
+
+_cache: dict[tuple, tuple[tuple[Firma, ...], Any]] = {}
+_estadisticas_cache = {"aciertos": 0, "fallos": 0}
+
+_candados: dict[str, threading.RLock] = {}
+_bloqueados: set[str] = set()
+
+
+class ConflictoVersion(Exception):  # noqa: N818
+    """El archivo fue modificado por otro proceso desde que se leyó."""
+
+
+def firma_archivo(ruta: str) -> Firma:
+    """Retorna la firma (versión) de un archivo: inodo, mtime_ns y tamaño."""
+    try:
+        info = os.stat(ruta)
+        return (info.st_ino, info.st_mtime_ns, info.st_size)
+    except FileNotFoundError:
+        return (0, 0, 0)
+
+
+@contextmanager
+def bloquear(ruta: str):
+    """
+    Bloqueo exclusivo asociado a una ruta, entre hilos y entre procesos
+    (mediante un archivo auxiliar en la carpeta oculta .locks/ junto al
+    archivo de datos, ya que este se reemplaza en cada escritura). Es
+    reentrante dentro de un mismo hilo.
+    """
+    candado = _candados.setdefault(ruta, threading.RLock())
+    with candado:
+        if ruta in _bloqueados:
+            yield
+            return
+
+        path = Path(ruta)
+        ruta_bloqueo = path.parent / ".locks" / f"{path.name}.lock"
+        ruta_bloqueo.parent.mkdir(parents=True, exist_ok=True)
+        with open(ruta_bloqueo, "a") as archivo_bloqueo:
+            if fcntl is not None:
+                fcntl.flock(archivo_bloqueo, fcntl.LOCK_EX)
+            _bloqueados.add(ruta)
+            try:
+                yield
+            finally:
+                _bloqueados.discard(ruta)
+
+
+def leer_con_cache(lector: Callable[..., Any], *rutas: str) -> Any:
+    """
+    Retorna el resultado de `lector(*rutas)`, reutilizando el resultado
+    anterior mientras ninguno de los archivos haya cambiado en disco.
+    Nota: *el resultado es compartido entre llamadas, por lo que no debe
+    modificarse*.
+    """
+    clave = (lector, rutas)
+    firmas = tuple(firma_archivo(ruta) for ruta in rutas)
+    guardado = _cache.get(clave)
+
+    if guardado is not None and guardado[0] == firmas:
+        _estadisticas_cache["aciertos"] += 1
+        return guardado[1]
+
+    _estadisticas_cache["fallos"] += 1
+    datos = lector(*rutas)
+    _cache[clave] = (firmas, datos)
+    return datos
+
+
+def actualizar_cache(datos: Any, lector: Callable[..., Any], *rutas: str):
+    """
+    Registra `datos` como el resultado vigente de `lector(*rutas)` para la
+    versión actual de los archivos. Se utiliza cuando se aplicó a los datos
+    en memoria el mismo cambio que se acaba de escribir en disco.
+    """
+    firmas = tuple(firma_archivo(ruta) for ruta in rutas)
+    _cache[(lector, rutas)] = (firmas, datos)
+
+
+def invalidar_cache(ruta: str) -> None:
+    """Descarta de la caché los resultados que dependen de la ruta."""
+    for clave in [c for c in _cache if ruta in c[1]]:
+        del _cache[clave]
+
+
+def estadisticas_cache() -> dict[str, int]:
+    """Retorna la cantidad de aciertos y fallos de la caché de lectura."""
+    return {**_estadisticas_cache, "entradas": len(_cache)}
 
 
 def crear_directorio(ruta: str) -> None:
@@ -20,6 +141,52 @@ def crear_directorio(ruta: str) -> None:
         path.mkdir(parents=True, exist_ok=True)
 
 
+def _reemplazar_atomico(
+    ruta: str,
+    escribir: Callable[[IO], None],
+    binario: bool = False,
+    comprimir: bool = False,
+):
+    """
+    Escribe el contenido en un archivo temporal (en la misma carpeta) y lo
+    mueve sobre la ruta indicada, de modo que los lectores nunca observan un
+    archivo escrito a medias. Con `comprimir`, el texto se escribe en
+    formato gzip a medida que se genera.
+    """
+    import tempfile
+
+    crear_directorio(ruta)
+    path = Path(ruta)
+    descriptor, temporal = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        modo = "wb" if binario or comprimir else "w"
+        codificacion = None if binario or comprimir else "utf-8"
+        with open(descriptor, modo, encoding=codificacion) as archivo:
+            if comprimir:
+                import gzip
+
+                with gzip.open(
+                    archivo, "wt", encoding="utf-8", compresslevel=6
+                ) as comprimido:
+                    escribir(comprimido)
+            else:
+                escribir(archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        if path.exists():
+            os.chmod(temporal, path.stat().st_mode)
+        else:
+            os.chmod(temporal, 0o644)
+        os.replace(temporal, ruta)
+    except BaseException:
+        Path(temporal).unlink(missing_ok=True)
+        raise
+    finally:
+        invalidar_cache(ruta)
+
+
 def copiar_archivo(ruta_archivo: str, ruta_destino: str):
     """Copia un archivo a la ruta de destino indicada."""
     try:
@@ -31,52 +198,489 @@ def copiar_archivo(ruta_archivo: str, ruta_destino: str):
         raise Exception("Error al copiar archivo.") from e
 
 
+def _abrir_texto(ruta: str) -> IO[str]:
+    """Abre un archivo de texto para leerlo (descomprimiendo los .gz)"""
+    if ruta.endswith(".gz"):
+        import gzip
+
+        return gzip.open(ruta, "rt", encoding="utf-8")
+    return open(ruta, encoding="utf-8")
+
+
 def leer_csv(ruta: str) -> list:
-    """Lee y retorna el contenido de un archivo .csv"""
+    """Lee y retorna el contenido de un archivo .csv (o .csv.gz)"""
+    import csv
+
     try:
-        with open(ruta, encoding="utf-8") as archivo:
+        with _abrir_texto(ruta) as archivo:
             lector = csv.DictReader(archivo)
             return list(lector)
     except FileNotFoundError:
         return []
 
 
-def guardar_csv(ruta: str, encabezados: list[str], datos: list):
-    """Crea o sobrescribe un archivo .csv en la ruta indicada."""
+def guardar_csv(
+    ruta: str, encabezados: list[str], datos: Iterable, comprimir: bool = False
+):
+    """
+    Crea o sobrescribe (de forma atómica, sin bloqueo entre procesos) un
+    archivo .csv (o .csv.gz, con `comprimir`). Las filas se escriben a
+    medida que se recorren los datos (pueden ser un generador).
+    """
+    import csv
+
+    def escribir(archivo: IO[str]):
+        escritor = csv.DictWriter(archivo, fieldnames=encabezados)
+        escritor.writeheader()
+        escritor.writerows(datos)
+
     try:
-        crear_directorio(ruta)
-        with open(ruta, "w", encoding="utf-8") as archivo:
-            escritor = csv.DictWriter(archivo, fieldnames=encabezados)
-            escritor.writeheader()
-            escritor.writerows(datos)
+        _reemplazar_atomico(ruta, escribir, comprimir=comprimir)
     except Exception as e:
         raise Exception("Error al guardar CSV.") from e
 
 
+def agregar_fila_csv(ruta: str, encabezados: list[str], fila: dict):
+    """
+    Agrega una fila al final de un archivo .csv (sin reescribirlo). Si el
+    archivo no existe o está vacío, se escriben primero los encabezados. Si
+    una escritura anterior quedó a medias (el archivo no termina en un salto
+    de línea), la fila comienza en una nueva línea, de modo que no se mezcla
+    con la fila incompleta.
+    """
+    import csv
+    import io
+
+    try:
+        texto = io.StringIO()
+        escritor = csv.DictWriter(texto, fieldnames=encabezados)
+        with bloquear(ruta):
+            invalidar_cache(ruta)
+            with open(ruta, "ab+") as archivo:
+                if archivo.tell() == 0:
+                    escritor.writeheader()
+                else:
+                    archivo.seek(-1, os.SEEK_END)
+                    if archivo.read(1) != b"\n":
+                        texto.write("\n")
+                escritor.writerow(fila)
+                archivo.write(texto.getvalue().encode("utf-8"))
+    except Exception as e:
+        raise Exception("Error al agregar fila CSV.") from e
+
+
 def leer_json(ruta: str) -> Any | None:
-    """Lee y retorna el contenido de un archivo .json"""
+    """Lee y retorna el contenido de un archivo .json (o .json.gz)"""
     try:
-        with open(ruta, encoding="utf-8") as archivo:
+        with _abrir_texto(ruta) as archivo:
             return json.load(archivo)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
 
-def guardar_json(ruta: str, datos: Any):
-    """Crea o sobrescribe un archivo .json en la ruta indicada."""
+def serializar_json_array(elementos: Iterable) -> Iterator[str]:
+    """
+    Genera, elemento a elemento, el texto de un arreglo JSON con el mismo
+    formato que json.dump(..., indent=4), sin construirlo completo en memoria.
+    """
+    yield "["
+    separador = "\n    "
+    for elemento in elementos:
+        texto = json.dumps(
+            elemento, indent=4, ensure_ascii=False, default=_serializar_json
+        )
+        yield separador + texto.replace("\n", "\n    ")
+        separador = ",\n    "
+    yield "\n]" if separador != "\n    " else "]"
+
+
+def guardar_json_array(ruta: str, elementos: Iterable):
+    """
+    Crea o sobrescribe un archivo .json con un arreglo, escribiendo los
+    elementos a medida que se recorren (pueden ser un generador).
+    """
+    try:
+        guardar_texto_plano(ruta, serializar_json_array(elementos))
+    except Exception as e:
+        raise Exception("Error al guardar JSON.") from e
+
+
+def iterar_json_array(ruta: str, tamano_bloque: int = 1 << 16) -> Iterator:
+    """
+    Recorre uno a uno los elementos de un archivo .json cuyo contenido es un
+    arreglo de objetos, sin cargar el archivo completo en memoria: el archivo
+    se mapea con mmap y se decodifica por bloques, descartando el texto ya
+    procesado. Si el archivo no existe o está vacío, no retorna elementos.
+    """
+    import codecs
+    import mmap
+
+    try:
+        archivo = open(ruta, "rb")
+    except FileNotFoundError:
+        return
+
+    with archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            decodificador = json.JSONDecoder()
+            utf8 = codecs.getincrementaldecoder("utf-8")()
+            texto, indice, desplazamiento = "", 0, 0
+
+            def cargar_bloque() -> bool:
+                """Agrega al texto el siguiente bloque del archivo."""
+                nonlocal texto, desplazamiento
+                if desplazamiento >= len(mapa):
+                    return False
+                bloque = mapa[desplazamiento : desplazamiento + tamano_bloque]
+                desplazamiento += len(bloque)
+                texto += utf8.decode(bloque, final=desplazamiento >= len(mapa))
+                return True
+
+            def saltar(caracteres: str) -> bool:
+                """Avanza el índice mientras encuentre los caracteres."""
+                nonlocal indice
+                while True:
+                    while indice < len(texto) and texto[indice] in caracteres:
+                        indice += 1
+                    if indice < len(texto):
+                        return True
+                    if not cargar_bloque():
+                        return False
+
+            if not saltar(" \t\r\n") or texto[indice] != "[":
+                raise ValueError(f"{ruta} no contiene un arreglo JSON.")
+            indice += 1
+
+            while True:
+                if not saltar(" \t\r\n,"):
+                    raise ValueError(f"{ruta} contiene un JSON incompleto.")
+                if texto[indice] == "]":
+                    return
+
+                try:
+                    elemento, indice = decodificador.raw_decode(texto, indice)
+                except json.JSONDecodeError:
+                    # El elemento continúa en el siguiente bloque
+                    if cargar_bloque():
+                        continue
+                    raise
+
+                yield elemento
+
+                if indice > tamano_bloque:
+                    texto, indice = texto[indice:], 0
+
+
+def guardar_json(
+    ruta: str, datos: Any, version: Firma | None = None, bloqueo: bool = True
+):
+    """
+    Crea o sobrescribe (de forma atómica) un archivo .json. Si se indica la
+    versión (firma) del archivo al momento de leerlo, y otro proceso lo
+    modificó desde entonces, se lanza ConflictoVersion sin escribir. Con
+    `bloqueo=False` (archivos que no se comparten entre procesos, Ej. las
+    exportaciones) se omiten el bloqueo y la verificación de versión.
+    """
+
+    def escribir(archivo: IO[str]):
+        json.dump(
+            datos,
+            archivo,
+            indent=4,
+            ensure_ascii=False,
+            default=_serializar_json,
+        )
+
     try:
-        crear_directorio(ruta)
-        with open(ruta, "w", encoding="utf-8") as archivo:
-            json.dump(datos, archivo, indent=4, ensure_ascii=False)
+        if not bloqueo:
+            _reemplazar_atomico(ruta, escribir)
+            return
+        with bloquear(ruta):
+            if version is not None and firma_archivo(ruta) != version:
+                raise ConflictoVersion(ruta)
+            _reemplazar_atomico(ruta, escribir)
+    except ConflictoVersion:
+        raise
     except Exception as e:
         raise Exception("Error al guardar JSON.") from e
 
 
-def guardar_texto_plano(ruta: str, contenido: str):
-    """Crea o sobrescribe un archivo de texto (.txt, .js) en la ruta indicada."""
+def _serializar_json(valor: Any) -> Any:
+    """Permite guardar en JSON objetos que se comportan como diccionario."""
+    if isinstance(valor, Mapping):
+        return dict(valor)
+    raise TypeError(f"{type(valor).__name__} no es serializable a JSON")
+
+
+def leer_json_lineas(ruta: str) -> list:
+    """
+    Lee un archivo JSON Lines (un objeto JSON por línea). Las líneas
+    incompletas (escrituras interrumpidas) se descartan.
+    """
+    return list(iterar_json_lineas(ruta))
+
+
+def iterar_json_lineas(ruta: str) -> Iterator:
+    """
+    Recorre uno a uno los registros de un archivo JSON Lines (descomprimiendo
+    los archivos .gz a medida que se leen). Una línea que no se puede
+    interpretar (un registro agregado a medias) se omite, sin descartar los
+    registros válidos que le siguen.
+    """
     try:
-        crear_directorio(ruta)
-        with open(ruta, "w", encoding="utf-8") as archivo:
-            archivo.write(contenido)
+        archivo = _abrir_texto(ruta)
+    except FileNotFoundError:
+        return
+
+    with archivo:
+        for linea in archivo:
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                continue
+            yield registro
+
+
+def guardar_json_lineas(
+    ruta: str, registros: Iterable, comprimir: bool = False
+):
+    """
+    Crea o sobrescribe un archivo JSON Lines (o .gz, con `comprimir`), con
+    un registro por línea, escribiéndolos a medida que se recorren (pueden
+    ser un generador).
+    """
+
+    def escribir(archivo: IO[str]):
+        for registro in registros:
+            archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+    try:
+        _reemplazar_atomico(ruta, escribir, comprimir=comprimir)
+    except Exception as e:
+        raise Exception("Error al guardar JSON Lines.") from e
+
+
+def agregar_json_lineas(ruta: str, registros: list):
+    """
+    Agrega registros al final de un archivo JSON Lines (sin reescribirlo).
+    Si una escritura anterior quedó a medias (el archivo no termina en un
+    salto de línea), los registros comienzan en una nueva línea, de modo que
+    solo se pierde la línea incompleta.
+    """
+    try:
+        lineas = "".join(
+            json.dumps(r, ensure_ascii=False) + "\n" for r in registros
+        )
+        with bloquear(ruta):
+            invalidar_cache(ruta)
+            with open(ruta, "ab+") as archivo:
+                if archivo.tell() > 0:
+                    archivo.seek(-1, os.SEEK_END)
+                    if archivo.read(1) != b"\n":
+                        lineas = "\n" + lineas
+                archivo.write(lineas.encode("utf-8"))
+    except Exception as e:
+        raise Exception("Error al agregar registros.") from e
+
+
+def tamano_archivo(ruta: str) -> int:
+    """Retorna el tamaño en bytes de un archivo (0 si no existe)."""
+    try:
+        return Path(ruta).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def eliminar_archivo(ruta: str):
+    """Elimina un archivo (si existe)."""
+    invalidar_cache(ruta)
+    Path(ruta).unlink(missing_ok=True)
+
+
+def mover_archivo(ruta_origen: str, ruta_destino: str):
+    """Mueve (reemplazando de forma atómica) un archivo a otra ruta."""
+    invalidar_cache(ruta_origen)
+    invalidar_cache(ruta_destino)
+    os.replace(ruta_origen, ruta_destino)
+
+
+def guardar_texto_plano(ruta: str, contenido: str | Iterable[str]):
+    """
+    Crea o sobrescribe un archivo de texto (.txt, .js) en la ruta indicada.
+    El contenido puede ser un texto o un iterable de textos, los cuales se
+    escriben a medida que se generan.
+    """
+    partes = [contenido] if isinstance(contenido, str) else contenido
+    try:
+        _reemplazar_atomico(ruta, lambda archivo: archivo.writelines(partes))
     except Exception as e:
         raise Exception("Error al guardar archivo.") from e
+
+
+# FORMATO BINARIO DE TAREAS
+# Encabezado: firma "TAR1", cantidad de tareas y cantidad de textos (u32).
+# Tabla de textos: largo (u32) + texto UTF-8, sin repetir (títulos y
+# categorías). Luego un registro de largo fijo por tarea:
+#   id, id_usuario (UUID, 16 bytes c/u), fecha_creacion y fecha_vencimiento
+#   (ordinal del día, u32; 0 = sin fecha), estado (u8, posición en
+#   EstadoTarea), título y categoría (u32, posición en la tabla de textos).
+FIRMA_BINARIO = b"TAR1"
+ENCABEZADO_BINARIO = struct.Struct("<4sII")
+REGISTRO_BINARIO = struct.Struct("<16s16sIIBII")
+ESTADOS_BINARIO: tuple[EstadoTarea, ...] = get_args(EstadoTarea)
+
+
+def guardar_tareas_binario(ruta: str, tareas: list[Tarea]):
+    """Crea o sobrescribe (de forma atómica) un archivo binario de tareas."""
+    textos: dict[str, int] = {}
+    estados = {estado: i for i, estado in enumerate(ESTADOS_BINARIO)}
+
+    def posicion_texto(texto: str) -> int:
+        return textos.setdefault(texto, len(textos))
+
+    registros = b"".join(
+        REGISTRO_BINARIO.pack(
+            _uuid_a_bytes(t["id"]),
+            _uuid_a_bytes(t["id_usuario"]),
+            _fecha_a_ordinal(t["fecha_creacion"]),
+            _fecha_a_ordinal(t["fecha_vencimiento"]),
+            estados[t["estado"]],
+            posicion_texto(t["titulo"]),
+            posicion_texto(t["categoria"]),
+        )
+        for t in tareas
+    )
+
+    def escribir(archivo: IO[bytes]):
+        archivo.write(
+            ENCABEZADO_BINARIO.pack(FIRMA_BINARIO, len(tareas), len(textos))
+        )
+        for texto in textos:
+            codificado = texto.encode("utf-8")
+            archivo.write(struct.pack("<I", len(codificado)))
+            archivo.write(codificado)
+        archivo.write(registros)
+
+    try:
+        with bloquear(ruta):
+            _reemplazar_atomico(ruta, escribir, binario=True)
+    except Exception as e:
+        raise Exception("Error al guardar archivo binario.") from e
+
+
+def leer_tareas_binario(
+    ruta: str, id_usuario: str | None = None, registros_por_bloque: int = 4096
+) -> list[Tarea]:
+    """
+    Lee un archivo binario de tareas (lista vacía si no existe o está
+    vacío). El archivo se mapea con mmap y los registros se recorren por
+    bloques, sin copiar el archivo completo en memoria. Si se indica
+    id_usuario, cada registro se filtra (comparando los bytes del usuario)
+    antes de construir la tarea, y solo se decodifican los textos de las
+    tareas del usuario.
+    """
+    import mmap
+
+    try:
+        archivo = open(ruta, "rb")
+    except FileNotFoundError:
+        return []
+
+    with archivo:
+        if os.fstat(archivo.fileno()).st_size == 0:
+            return []
+
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if mapa[: len(FIRMA_BINARIO)] != FIRMA_BINARIO:
+                raise ValueError(f"{ruta} no es un archivo binario de tareas.")
+            _, cantidad, cantidad_textos = ENCABEZADO_BINARIO.unpack_from(mapa)
+
+            # Solo se registra dónde comienza cada texto; se decodifica (una
+            # única vez) la primera vez que una tarea lo utiliza
+            inicios_textos: list[int] = []
+            posicion = ENCABEZADO_BINARIO.size
+            for _ in range(cantidad_textos):
+                (largo,) = struct.unpack_from("<I", mapa, posicion)
+                inicios_textos.append(posicion)
+                posicion += 4 + largo
+            textos: dict[int, str] = {}
+
+            def texto(indice: int) -> str:
+                valor = textos.get(indice)
+                if valor is None:
+                    inicio = inicios_textos[indice]
+                    (largo,) = struct.unpack_from("<I", mapa, inicio)
+                    valor = mapa[inicio + 4 : inicio + 4 + largo].decode()
+                    textos[indice] = valor
+                return valor
+
+            filtro = None if id_usuario is None else _uuid_a_bytes(id_usuario)
+            fin = posicion + cantidad * REGISTRO_BINARIO.size
+            tamano_bloque = registros_por_bloque * REGISTRO_BINARIO.size
+            tareas: list[Tarea] = []
+
+            for inicio in range(posicion, fin, tamano_bloque):
+                bloque = mapa[inicio : min(inicio + tamano_bloque, fin)]
+                for (
+                    id_tarea,
+                    usuario,
+                    creacion,
+                    vencimiento,
+                    estado,
+                    titulo,
+                    categoria,
+                ) in REGISTRO_BINARIO.iter_unpack(bloque):
+                    if filtro is not None and usuario != filtro:
+                        continue
+                    tareas.append(
+                        {
+                            "id": _bytes_a_uuid(id_tarea),
+                            "id_usuario": _bytes_a_uuid_usuario(usuario),
+                            "fecha_creacion": _ordinal_a_fecha(creacion),
+                            "fecha_vencimiento": _ordinal_a_fecha(vencimiento),
+                            "titulo": texto(titulo),
+                            "categoria": texto(categoria),
+                            "estado": ESTADOS_BINARIO[estado],
+                        }
+                    )
+
+    return tareas
+
+
+def _uuid_a_bytes(texto: str) -> bytes:
+    """Convierte un UUID en texto a sus 16 bytes."""
+    valor = bytes.fromhex(texto.replace("-", ""))
+    if len(valor) != 16:
+        raise ValueError(f"Identificador inválido: {texto}")
+    return valor
+
+
+def _bytes_a_uuid(valor: bytes) -> str:
+    """Convierte 16 bytes al UUID en texto (8-4-4-4-12)."""
+    h = valor.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@cache
+def _bytes_a_uuid_usuario(valor: bytes) -> str:
+    """Igual que _bytes_a_uuid, reutilizando el texto (pocos usuarios)."""
+    return _bytes_a_uuid(valor)
+
+
+@cache
+def _ordinal_a_fecha(ordinal: int) -> str | None:
+    """Convierte el ordinal del día a fecha dd-mm-aaaa (None si es 0)."""
+    if ordinal == 0:
+        return None
+    return date.fromordinal(ordinal).strftime("%d-%m-%Y")
+
+
+def _fecha_a_ordinal(fecha: str | None) -> int:
+    """Convierte una fecha dd-mm-aaaa al ordinal del día (0 si no hay)."""
+    if fecha is None:
+        return 0
+    dia, mes, anio = fecha.split("-")
+    return date(int(anio), int(mes), int(dia)).toordinal()
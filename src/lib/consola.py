@@ -4,39 +4,68 @@ Interfaz de interacción por consola (CLI).
 Centralización de todas las funciones de entrada y salida de datos.
 Proporciona métodos para mostrar alertas, errores y solicitar datos validados,
 asegurando una UI consistente en toda la aplicación.
+
+Cuando la salida es una terminal, `pantalla_completa` muestra la aplicación en
+la pantalla alternativa: cada pantalla (panel o tabla) se dibuja en la parte
+superior, reescribiendo solo las líneas que cambiaron respecto a la anterior,
+y las entradas del usuario se desplazan en una región debajo de ella. Si la
+salida no es una terminal, se limpia imprimiendo saltos de línea.
+
+Los componentes de rich se importan recién al mostrar algo por primera vez
+(y Table solo al imprimir tablas), ya que su importación domina el tiempo de
+inicio de los comandos que no los utilizan (Ej. `--formato json`).
 """
 
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import date
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
 
-from rich import box
-from rich.console import Console
-from rich.padding import Padding
-from rich.panel import Panel
-from rich.table import Table
-from rich.theme import Theme
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
 
 
 ANCHO = 60
 PADDING = 4
 
 
-tema = Theme(
-    {
-        "ok": "green",
-        "error": "red",
-        "input": "blue",
-        "alerta": "yellow",
-        "info": "yellow",
-    }
-)
+TEMA = {
+    "ok": "green",
+    "error": "red",
+    "input": "blue",
+    "alerta": "yellow",
+    "info": "yellow",
+}
+
+# Secuencias de control ANSI utilizadas por la pantalla completa
+CSI = "\x1b["
+LIMPIAR_LINEA = f"{CSI}K"
+LIMPIAR_DEBAJO = f"{CSI}J"
+RESTABLECER_REGION = f"{CSI}r"
+
 
-consola = Console(theme=tema)
+# Estado de la pantalla completa: si está activa, si se está mostrando la
+# pantalla alternativa (o la normal, para una pantalla que no cabe en la
+# terminal), las líneas de la pantalla actual y el tamaño de la terminal
+# con el que se dibujaron
+_pantalla: dict = {
+    "activa": False,
+    "alternativa": False,
+    "lineas": [],
+    "tamano": None,
+}
 
 
 def input_confirmar(mensaje: str) -> bool:
     """Solicita y valida una respuesta booleana (s/n)."""
     while True:
-        respuesta = consola.input(f"[input]{mensaje} (s/n):[/] ").lower()
+        respuesta = _consola().input(f"[input]{mensaje} (s/n):[/] ").lower()
 
         if respuesta in ["s", "n"]:
             return respuesta == "s"
@@ -45,7 +74,7 @@ def input_confirmar(mensaje: str) -> bool:
 
 def input_continuar(mensaje: str) -> None:
     """Simula una pausa. Usuario debe presionar ENTER para continuar."""
-    consola.input(
+    _consola().input(
         f"[plum1]Presione [bold]ENTER[/bold] para {mensaje}...[/plum1] "
     )
 
@@ -59,7 +88,7 @@ def input_entero(
 
     while True:
         try:
-            numero = int(consola.input(f"[input]{mensaje}:[/] "))
+            numero = int(_consola().input(f"[input]{mensaje}:[/] "))
 
             if (
                 min is not None
@@ -91,7 +120,7 @@ def input_entero(
 def input_fecha(mensaje: str, permitir_vacio: bool = True):
     """Solicita y valida una fecha con formato dd-mm-aaaa"""
     while True:
-        fecha = consola.input(f"[input]{mensaje}:[/] ")
+        fecha = _consola().input(f"[input]{mensaje}:[/] ")
         if fecha == "" and permitir_vacio:
             return "-"
 
@@ -106,6 +135,58 @@ def input_fecha(mensaje: str, permitir_vacio: bool = True):
             print_error(error)
 
 
+def input_indices(mensaje: str, max: int) -> list[int]:
+    """
+    Solicita uno o varios números entre 1 y max, separados por coma y/o
+    como rangos (Ej. 1,3,5-8). Retorna los números sin repetir y en orden.
+    """
+    while True:
+        texto = _consola().input(f"[input]{mensaje}:[/] ")
+        try:
+            indices: set[int] = set()
+            for parte in texto.replace(" ", "").split(","):
+                inicio, _, fin = parte.partition("-")
+                desde, hasta = int(inicio), int(fin or inicio)
+                if desde > hasta:
+                    desde, hasta = hasta, desde
+                if desde < 1 or hasta > max:
+                    error = f"Los números deben estar entre 1 y {max}."
+                    raise ValueError(error)
+                indices.update(range(desde, hasta + 1))
+            return sorted(indices)
+        except ValueError as e:
+            error = (
+                str(e)
+                if "invalid literal" not in str(e)
+                else "Formato inválido. Ej. 1,3,5-8"
+            )
+            print_error(error)
+
+
+def input_pagina(pagina: int, paginas: int) -> int | None:
+    """
+    Solicita la navegación entre páginas: 's' (siguiente), 'a' (anterior) o
+    el N° de la página. Retorna la página elegida, o None (ENTER) si el
+    usuario desea continuar.
+    """
+    opciones = "s=siguiente, a=anterior, N°=ir a página, ENTER=continuar"
+    while True:
+        respuesta = _consola().input(
+            f"[input]Página {pagina}/{paginas} ({opciones}):[/] "
+        )
+        respuesta = respuesta.strip().lower()
+
+        if respuesta == "":
+            return None
+        if respuesta == "s" and pagina < paginas:
+            return pagina + 1
+        if respuesta == "a" and pagina > 1:
+            return pagina - 1
+        if respuesta.isdigit() and 1 <= int(respuesta) <= paginas:
+            return int(respuesta)
+        print_error(f"Opción inválida. Las páginas van de 1 a {paginas}.")
+
+
 def input_texto(mensaje: str, min_len: int = 1, max_len: int = 50) -> str:
     """Solicita texto y valida que su longitud esté en el rango indicado."""
     if min_len > max_len:
@@ -114,7 +195,7 @@ def input_texto(mensaje: str, min_len: int = 1, max_len: int = 50) -> str:
         )
 
     while True:
-        texto = consola.input(f"[input]{mensaje}:[/] ")
+        texto = _consola().input(f"[input]{mensaje}:[/] ")
 
         if len(texto) <= max_len and len(texto) >= min_len:
             return texto
@@ -122,15 +203,20 @@ def input_texto(mensaje: str, min_len: int = 1, max_len: int = 50) -> str:
 
 
 def print_alerta(mensaje: str) -> None:
-    consola.print(f"[alerta]{mensaje}[/]\n")
+    _consola().print(f"[alerta]{mensaje}[/]\n")
 
 
 def print_error(mensaje: str) -> None:
-    consola.print(f"[error]{mensaje}[/]\n")
+    _consola().print(f"[error]{mensaje}[/]\n")
 
 
 def print_exito(mensaje: str) -> None:
-    consola.print(f"[ok]{mensaje}[/]\n")
+    _consola().print(f"[ok]{mensaje}[/]\n")
+
+
+def print_json(datos: Any) -> None:
+    """Imprime datos como JSON en una sola línea (para otros programas)."""
+    sys.stdout.write(json.dumps(datos, ensure_ascii=False) + "\n")
 
 
 def print_panel(
@@ -141,27 +227,34 @@ def print_panel(
     limpiar: bool = True,
 ) -> None:
     """Imprime un Panel en consola (Contenedor con bordes)"""
+    from rich.padding import Padding
+    from rich.panel import Panel
+
     contenido = contenido.center(ANCHO - PADDING * 3) if centrar else contenido
-    consola.print(
-        "\n" * 60 if limpiar else "",
-        Panel(
-            Padding(f"[bold bright_white]{contenido}[/]", (1, PADDING)),
-            title=f"[bold blue_violet]{titulo}[/]",
-            border_style="light_steel_blue",
-            subtitle=subtitulo,
-            width=ANCHO,
-        ),
-        "",
+    panel = Panel(
+        Padding(f"[bold bright_white]{contenido}[/]", (1, PADDING)),
+        title=f"[bold blue_violet]{titulo}[/]",
+        border_style="light_steel_blue",
+        subtitle=subtitulo,
+        width=ANCHO,
     )
+    if limpiar:
+        _mostrar_pantalla(panel)
+    else:
+        _consola().print("", panel, "")
 
 
 def print_tabla(
     titulo: str,
     columnas: list[str],
-    filas: list[list[str]],
+    filas: Iterable[list[str]],
     caption: str | None = None,
+    limpiar: bool = True,
 ) -> None:
     """Imprime una tabla en consola."""
+    from rich import box
+    from rich.table import Table
+
     tabla = Table(
         title=titulo,
         box=box.HORIZONTALS,
@@ -178,14 +271,19 @@ def print_tabla(
     for fila in filas:
         tabla.add_row(*fila)
 
-    consola.print("\n" * 60, tabla, "")
+    if limpiar:
+        _mostrar_pantalla(tabla)
+    else:
+        _consola().print("", tabla, "")
 
 
 def print_toast(mensaje_toast: str, mensaje_pausa: str = "continuar"):
     """Imprime un Panel en consola y agrega una pausa."""
+    from rich.panel import Panel
+
     tipo, mensaje = mensaje_toast.split(":")
 
-    consola.print(
+    _consola().print(
         "",
         Panel(
             mensaje.center(ANCHO - 4),
@@ -195,3 +293,89 @@ def print_toast(mensaje_toast: str, mensaje_pausa: str = "continuar"):
         ),
     )
     input_continuar(mensaje_pausa)
+
+
+@contextmanager
+def pantalla_completa() -> Iterator[None]:
+    """
+    Muestra la aplicación en la pantalla alternativa de la terminal (sin
+    afectar el historial), restaurando la pantalla normal al salir. Si la
+    salida no es una terminal, no realiza cambios.
+    """
+    if not _consola().set_alt_screen(True):
+        yield
+        return
+
+    _pantalla.update(activa=True, alternativa=True, lineas=[], tamano=None)
+    try:
+        yield
+    finally:
+        if _pantalla["alternativa"]:
+            _escribir(RESTABLECER_REGION)
+            _consola().set_alt_screen(False)
+        _pantalla.update(
+            activa=False, alternativa=False, lineas=[], tamano=None
+        )
+
+
+def _mostrar_pantalla(contenido: "Panel | Table") -> None:
+    """
+    Muestra una nueva pantalla, reemplazando la anterior. En pantalla
+    completa se reescriben solo las líneas que cambiaron, y bajo ellas se
+    deja una región de desplazamiento para las entradas del usuario.
+    """
+    if not _pantalla["activa"]:
+        _consola().print("\n" * 60, contenido, "")
+        return
+
+    with _consola().capture() as captura:
+        _consola().print(contenido, "")
+    lineas = captura.get().splitlines()
+    tamano = _consola().size
+    inicio_region = len(lineas) + 1
+
+    # Si la pantalla no cabe en la terminal, se muestra en la pantalla
+    # normal (donde se mantiene hasta una pantalla que sí quepa) para que el
+    # usuario pueda desplazarse por ella
+    if inicio_region >= tamano.height:
+        if _pantalla["alternativa"]:
+            _escribir(RESTABLECER_REGION)
+            _consola().set_alt_screen(False)
+        _consola().print("\n" * 60, contenido, "")
+        _pantalla.update(alternativa=False, lineas=[], tamano=None)
+        return
+
+    if not _pantalla["alternativa"]:
+        _consola().set_alt_screen(True)
+        _pantalla.update(alternativa=True, lineas=[])
+
+    anteriores = _pantalla["lineas"] if _pantalla["tamano"] == tamano else []
+    salida = [RESTABLECER_REGION]
+    for numero, linea in enumerate(lineas):
+        if numero < len(anteriores) and anteriores[numero] == linea:
+            continue
+        salida.append(f"{CSI}{numero + 1};1H{linea}{LIMPIAR_LINEA}")
+    # La región bajo la pantalla se limpia y se limita el desplazamiento a
+    # ella, de modo que las líneas dibujadas permanezcan en su posición
+    salida += [
+        f"{CSI}{inicio_region};{tamano.height}r",
+        f"{CSI}{inicio_region};1H",
+        LIMPIAR_DEBAJO,
+    ]
+    _escribir("".join(salida))
+    _pantalla.update(lineas=lineas, tamano=tamano)
+
+
+@cache
+def _consola() -> "Console":
+    """Crea (una única vez, al primer uso) la consola de rich."""
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(theme=Theme(TEMA))
+
+
+def _escribir(secuencia: str) -> None:
+    """Escribe texto (o secuencias de control) directamente en la salida."""
+    _consola().file.write(secuencia)
+    _consola().file.flush()
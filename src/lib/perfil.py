@@ -0,0 +1,54 @@
+"""
+Perfil del tiempo de inicio.
+
+Importa un módulo en un proceso nuevo con `python -X importtime` y resume el
+tiempo de importación de cada módulo, de modo que las regresiones en el
+tiempo de inicio (Ej. una importación costosa agregada al nivel de módulo)
+se puedan detectar y comparar entre versiones.
+"""
+
+import subprocess
+import sys
+
+
+# (módulo, microsegundos propios, microsegundos acumulados)
+TiempoImportacion = tuple[str, int, int]
+
+
+def perfilar_importacion(
+    modulo: str, repeticiones: int = 5
+) -> list[TiempoImportacion]:
+    """
+    Importa el módulo en `repeticiones` procesos nuevos y retorna el tiempo
+    de importación de cada módulo cargado (el mínimo entre las repeticiones,
+    para descartar ruido), ordenados de mayor a menor tiempo acumulado.
+    """
+    mejores: dict[str, TiempoImportacion] = {}
+    for _ in range(repeticiones):
+        for nombre, propio, acumulado in _medir_importacion(modulo):
+            previo = mejores.get(nombre)
+            if previo is None or acumulado < previo[2]:
+                mejores[nombre] = (nombre, propio, acumulado)
+    return sorted(mejores.values(), key=lambda t: t[2], reverse=True)
+
+
+def _medir_importacion(modulo: str) -> list[TiempoImportacion]:
+    """Ejecuta `python -X importtime` e interpreta su salida (stderr)."""
+    try:
+        resultado = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise Exception(f"Error al importar {modulo}.") from e
+
+    tiempos = []
+    for linea in resultado.stderr.splitlines():
+        propio, _, resto = linea.removeprefix("import time:").partition("|")
+        acumulado, _, nombre = resto.partition("|")
+        # Se omite el encabezado y cualquier otra línea de la salida
+        if propio.strip().isdigit() and acumulado.strip().isdigit():
+            tiempos.append((nombre.strip(), int(propio), int(acumulado)))
+    return tiempos
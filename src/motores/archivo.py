@@ -0,0 +1,262 @@
+"""
+Motor de almacenamiento basado en archivos (CSV + JSON).
+
+Los usuarios se almacenan en usuarios.csv y se consultan mediante un índice
+en memoria (nombre_usuario -> usuario), construido una única vez por cada
+versión del archivo. Las tareas se almacenan en modo "diario":
+tareas.json es una instantánea y cada modificación se agrega como un
+registro pequeño al diario de tareas. Las lecturas reproducen la
+instantánea + el diario, y cuando el diario supera el tamaño límite se
+compacta (se integra en la instantánea y se vacía). La compactación escribe
+primero la nueva instantánea en un archivo aparte (<instantánea>.nueva), y la
+eliminación del diario la confirma; si se interrumpe, la siguiente operación
+la completa o la descarta según los archivos presentes.
+
+La instantánea puede guardarse opcionalmente en formato binario compacto
+(Config.FORMATO_TAREAS = "binario"). La instantánea vigente es la más
+reciente de ambos formatos, por lo que al cambiar de formato se sigue
+leyendo la del formato anterior (nunca una copia desactualizada del nuevo),
+y la siguiente modificación la migra al formato elegido.
+"""
+
+from pathlib import Path
+
+import src.lib.archivos as gestor
+from src.definiciones.constantes import Config, Limites, Rutas
+from src.definiciones.schemas import OperacionTarea, Tarea, Usuario
+from src.motores.operaciones import reproducir_operaciones
+
+
+def buscar_usuario(nombre_usuario: str) -> Usuario | None:
+    """Busca un usuario registrado (mediante nombre de usuario)."""
+    return _indice_usuarios().get(nombre_usuario)
+
+
+def crear_usuario(usuario: Usuario) -> bool:
+    """
+    Crea un usuario en el sistema de almacenamiento. La existencia del
+    nombre de usuario se verifica nuevamente bajo bloqueo, ya que otro
+    proceso pudo registrarlo. Retorna False si ya existía.
+    """
+    with gestor.bloquear(Rutas.USUARIOS):
+        indice = _indice_usuarios()
+        if usuario["nombre_usuario"] in indice:
+            return False
+
+        encabezados = list(usuario.keys())
+        gestor.agregar_fila_csv(Rutas.USUARIOS, encabezados, usuario)
+
+        # Se agrega el usuario al índice y se asocia a la nueva versión del
+        # archivo, evitando reconstruir el índice en la siguiente consulta
+        indice[usuario["nombre_usuario"]] = usuario
+        gestor.actualizar_cache(
+            indice, _construir_indice_usuarios, Rutas.USUARIOS
+        )
+        return True
+
+
+def obtener_usuarios() -> list[Usuario]:
+    """Obtiene todos los usuarios registrados."""
+    return list(_indice_usuarios().values())
+
+
+def obtener_tareas() -> list[Tarea]:
+    """Obtiene las tareas de todos los usuarios (solo lectura)."""
+    return _leer_tareas()
+
+
+def obtener_tareas_usuario(id_usuario: str) -> list[Tarea]:
+    """
+    Obtiene las tareas de un usuario mediante el id_usuario. La instantánea
+    se recorre de forma incremental y solo se conservan las tareas del
+    usuario, por lo que la memoria utilizada depende de sus propias tareas
+    y no del total de tareas almacenadas.
+    """
+    with gestor.bloquear(Rutas.DIARIO_TAREAS):
+        _recuperar_compactacion()
+        tareas_usuario = _leer_instantanea(_ruta_instantanea(), id_usuario)
+        operaciones = [
+            o
+            for o in gestor.leer_json_lineas(Rutas.DIARIO_TAREAS)
+            if _usuario_operacion(o) == id_usuario
+        ]
+
+    if not operaciones:
+        return tareas_usuario
+    return reproducir_operaciones(tareas_usuario, operaciones)
+
+
+def aplicar_operaciones(operaciones: list[OperacionTarea]):
+    """
+    Agrega las operaciones al diario (en una única escritura) y lo compacta
+    si supera el tamaño límite.
+    """
+    with gestor.bloquear(Rutas.DIARIO_TAREAS):
+        # Una compactación interrumpida se resuelve antes de agregar, ya que
+        # las nuevas operaciones no deben mezclarse con un diario confirmado
+        _recuperar_compactacion()
+        gestor.agregar_json_lineas(Rutas.DIARIO_TAREAS, operaciones)
+        tamano = gestor.tamano_archivo(Rutas.DIARIO_TAREAS)
+        if (
+            tamano > Limites.DIARIO_MAX_BYTES
+            or _ruta_instantanea() != _rutas_formato()[0]
+        ):
+            compactar_diario()
+
+
+def compactar_diario():
+    """
+    Integra las operaciones del diario en la instantánea y vacía el diario.
+    Las operaciones no son idempotentes (Ej. eliminar las finalizadas y
+    luego finalizar otra tarea), por lo que el diario nunca debe
+    reproducirse sobre una instantánea que ya lo incluye. Para ello:
+
+    1) La nueva instantánea se escribe completa en <instantánea>.nueva.
+    2) Se elimina el diario, lo que confirma la compactación.
+    3) La nueva instantánea reemplaza a la anterior, y se elimina la del
+       otro formato (si existe).
+
+    Si el proceso se interrumpe entre los pasos, _recuperar_compactacion
+    descarta la nueva instantánea (antes de 2) o completa el reemplazo
+    (después de 2). Se realiza bajo el bloqueo del diario, por lo que
+    ningún otro proceso puede agregar operaciones entre la lectura y el
+    vaciado. Si la instantánea vigente está en el otro formato, se migra
+    aunque el diario esté vacío.
+    """
+    with gestor.bloquear(Rutas.DIARIO_TAREAS):
+        _recuperar_compactacion()
+        ruta, ruta_otro_formato = _rutas_formato()
+        if (
+            gestor.tamano_archivo(Rutas.DIARIO_TAREAS) == 0
+            and _ruta_instantanea() == ruta
+        ):
+            return
+
+        tareas = _leer_tareas()
+        if ruta == Rutas.TAREAS_BINARIO:
+            gestor.guardar_tareas_binario(_ruta_nueva(ruta), tareas)
+        else:
+            gestor.guardar_json(_ruta_nueva(ruta), tareas)
+        gestor.eliminar_archivo(Rutas.DIARIO_TAREAS)
+        gestor.mover_archivo(_ruta_nueva(ruta), ruta)
+        gestor.eliminar_archivo(ruta_otro_formato)
+
+
+def _ruta_nueva(ruta: str) -> str:
+    """Retorna la ruta de la instantánea en construcción."""
+    return f"{ruta}.nueva"
+
+
+def _compactaciones_pendientes() -> list[str]:
+    """Retorna las instantáneas con una compactación sin completar."""
+    return [
+        ruta
+        for ruta in (Rutas.TAREAS, Rutas.TAREAS_BINARIO)
+        if Path(_ruta_nueva(ruta)).exists()
+    ]
+
+
+def _recuperar_compactacion() -> bool:
+    """
+    Completa o descarta una compactación interrumpida (debe llamarse bajo el
+    bloqueo del diario). Mientras el diario exista la compactación no fue
+    confirmada y la instantánea nueva se descarta; si el diario ya fue
+    eliminado, la instantánea nueva incluye sus operaciones y reemplaza a la
+    anterior. Retorna True si había una compactación pendiente.
+    """
+    pendientes = _compactaciones_pendientes()
+    for ruta in pendientes:
+        if Path(Rutas.DIARIO_TAREAS).exists():
+            gestor.eliminar_archivo(_ruta_nueva(ruta))
+        else:
+            gestor.mover_archivo(_ruta_nueva(ruta), ruta)
+    return bool(pendientes)
+
+
+def _rutas_formato() -> tuple[str, str]:
+    """Retorna la ruta de la instantánea del formato elegido y la del otro."""
+    if Config.FORMATO_TAREAS == "binario":
+        return Rutas.TAREAS_BINARIO, Rutas.TAREAS
+    return Rutas.TAREAS, Rutas.TAREAS_BINARIO
+
+
+def _ruta_instantanea() -> str:
+    """
+    Retorna la ruta de la instantánea vigente: la del formato elegido, o la
+    del otro formato si es más reciente (Ej. tras cambiar el formato, hasta
+    que se migre), de modo que nunca se lee una instantánea desactualizada.
+    """
+    ruta, ruta_otro_formato = _rutas_formato()
+    _, modificacion, _ = gestor.firma_archivo(ruta)
+    _, modificacion_otro_formato, _ = gestor.firma_archivo(ruta_otro_formato)
+    if modificacion_otro_formato > modificacion:
+        return ruta_otro_formato
+    return ruta
+
+
+def _leer_instantanea(ruta: str, id_usuario: str | None = None) -> list[Tarea]:
+    """
+    Lee la instantánea (JSON o binaria). Si se indica id_usuario, solo se
+    conservan las tareas de ese usuario, recorriendo el archivo sin
+    cargarlo completo en memoria.
+    """
+    if ruta == Rutas.TAREAS_BINARIO:
+        return gestor.leer_tareas_binario(ruta, id_usuario)
+    if id_usuario is None:
+        return gestor.leer_json(ruta) or []
+    return [
+        t
+        for t in gestor.iterar_json_array(ruta)
+        if t["id_usuario"] == id_usuario
+    ]
+
+
+def _usuario_operacion(operacion: OperacionTarea) -> str:
+    """Retorna el id del usuario dueño de las tareas de una operación."""
+    if operacion["op"] == "crear":
+        return operacion["tarea"]["id_usuario"]
+    return operacion["id_usuario"]
+
+
+def _indice_usuarios() -> dict[str, Usuario]:
+    """Obtiene (desde la caché si no ha cambiado) el índice de usuarios."""
+    return gestor.leer_con_cache(_construir_indice_usuarios, Rutas.USUARIOS)
+
+
+def _construir_indice_usuarios(ruta: str) -> dict[str, Usuario]:
+    """Construye el índice nombre_usuario -> usuario desde el .csv"""
+    usuarios: list[Usuario] = gestor.leer_csv(ruta)
+    return {u["nombre_usuario"]: u for u in usuarios}
+
+
+def _leer_tareas() -> list[Tarea]:
+    """
+    Obtiene las tareas desde la caché, la cual se reconstruye solo si la
+    instantánea o el diario cambiaron en disco. Una compactación
+    interrumpida se resuelve antes, ya que la caché podría corresponder a
+    la instantánea anterior.
+    """
+    if _compactaciones_pendientes():
+        with gestor.bloquear(Rutas.DIARIO_TAREAS):
+            _recuperar_compactacion()
+    return gestor.leer_con_cache(
+        _reconstruir_tareas, _ruta_instantanea(), Rutas.DIARIO_TAREAS
+    )
+
+
+def _reconstruir_tareas(
+    ruta_instantanea: str, ruta_diario: str
+) -> list[Tarea]:
+    """
+    Reconstruye las tareas a partir de la instantánea y el diario. La
+    lectura se realiza bajo el bloqueo del diario para no observar una
+    compactación a medias (instantánea antigua con el diario ya vaciado).
+    """
+    with gestor.bloquear(ruta_diario):
+        if _recuperar_compactacion():
+            ruta_instantanea = _ruta_instantanea()
+        tareas = _leer_instantanea(ruta_instantanea)
+        operaciones = gestor.leer_json_lineas(ruta_diario)
+    if not operaciones:
+        return tareas
+    return reproducir_operaciones(tareas, operaciones)
@@ -0,0 +1,130 @@
+"""
+Motor de almacenamiento con tareas fragmentadas por usuario.
+
+Las tareas de cada usuario se almacenan en su propio archivo
+(Rutas.TAREAS_FRAGMENTOS/<id_usuario>.json), por lo que las consultas y
+escrituras solo dependen de la cantidad de tareas del usuario, y no del
+total de usuarios. Los usuarios se siguen almacenando en usuarios.csv.
+Incluye la migración desde el archivo único de tareas:
+
+    python -m src.motores.fragmentado
+"""
+
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+
+import src.lib.archivos as gestor
+import src.motores.archivo as motor_archivo
+from src.definiciones.constantes import Limites, Rutas
+from src.definiciones.schemas import OperacionTarea, Tarea, Usuario
+from src.motores.operaciones import reproducir_operaciones
+
+
+def buscar_usuario(nombre_usuario: str) -> Usuario | None:
+    """Busca un usuario registrado (mediante nombre de usuario)."""
+    return motor_archivo.buscar_usuario(nombre_usuario)
+
+
+def crear_usuario(usuario: Usuario) -> bool:
+    """Crea un usuario en el sistema de almacenamiento."""
+    return motor_archivo.crear_usuario(usuario)
+
+
+def obtener_usuarios() -> list[Usuario]:
+    """Obtiene todos los usuarios registrados."""
+    return motor_archivo.obtener_usuarios()
+
+
+def obtener_tareas() -> Iterator[Tarea]:
+    """
+    Recorre, fragmento por fragmento, las tareas de todos los usuarios. Los
+    fragmentos se leen sin pasar por la caché, la cual de otro modo
+    retendría en memoria las tareas de todos los usuarios.
+    """
+    for ruta in sorted(Path(Rutas.TAREAS_FRAGMENTOS).glob("*.json")):
+        yield from gestor.leer_json(str(ruta)) or []
+
+
+def obtener_tareas_usuario(id_usuario: str) -> list[Tarea]:
+    """Obtiene las tareas de un usuario mediante el id_usuario."""
+    # Se retornan copias, ya que las tareas leídas se comparten con la caché
+    return [dict(t) for t in _leer_fragmento(id_usuario)]
+
+
+def aplicar_operaciones(operaciones: list[OperacionTarea]):
+    """
+    Aplica las operaciones agrupándolas por usuario, de modo que cada
+    fragmento afectado se lee y se escribe una única vez.
+    """
+    por_usuario: dict[str, list[OperacionTarea]] = defaultdict(list)
+    for operacion in operaciones:
+        id_usuario = (
+            operacion["tarea"]["id_usuario"]
+            if operacion["op"] == "crear"
+            else operacion["id_usuario"]
+        )
+        por_usuario[id_usuario].append(operacion)
+
+    for id_usuario, operaciones_usuario in por_usuario.items():
+        _actualizar_fragmento(id_usuario, operaciones_usuario)
+
+
+def migrar_desde_archivo() -> tuple[int, int]:
+    """
+    Reparte las tareas del archivo único (instantánea + diario) en un
+    fragmento por usuario. Los fragmentos se sobrescriben con el contenido
+    del archivo único, por lo que la migración puede repetirse. Retorna la
+    cantidad de fragmentos y tareas escritas.
+    """
+    por_usuario: dict[str, list[Tarea]] = defaultdict(list)
+    for tarea in motor_archivo.obtener_tareas():
+        por_usuario[tarea["id_usuario"]].append(tarea)
+
+    for id_usuario, tareas in por_usuario.items():
+        _guardar_fragmento(id_usuario, tareas)
+
+    return (len(por_usuario), sum(len(t) for t in por_usuario.values()))
+
+
+def _ruta_fragmento(id_usuario: str) -> str:
+    """Retorna la ruta del archivo de tareas de un usuario."""
+    return f"{Rutas.TAREAS_FRAGMENTOS}{id_usuario}.json"
+
+
+def _leer_fragmento(id_usuario: str) -> list[Tarea]:
+    """Lee (desde la caché si no ha cambiado) las tareas de un usuario."""
+    ruta = _ruta_fragmento(id_usuario)
+    return gestor.leer_con_cache(gestor.leer_json, ruta) or []
+
+
+def _actualizar_fragmento(id_usuario: str, operaciones: list[OperacionTarea]):
+    """
+    Aplica las operaciones sobre el fragmento con control optimista: si otro
+    proceso modificó el fragmento entre la lectura y la escritura, se vuelve
+    a leer y se reintenta, en lugar de sobrescribir sus cambios.
+    """
+    ruta = _ruta_fragmento(id_usuario)
+    for _ in range(Limites.REINTENTOS_ESCRITURA):
+        version = gestor.firma_archivo(ruta)
+        tareas = _leer_fragmento(id_usuario)
+        actualizadas = reproducir_operaciones(tareas, operaciones)
+        try:
+            gestor.guardar_json(ruta, actualizadas, version=version)
+            return
+        except gestor.ConflictoVersion:
+            continue
+    raise Exception("Error al guardar tareas: conflicto de escritura.")
+
+
+def _guardar_fragmento(id_usuario: str, tareas: list[Tarea]):
+    """Sobrescribe el archivo de tareas de un usuario."""
+    gestor.guardar_json(_ruta_fragmento(id_usuario), tareas)
+
+
+if __name__ == "__main__":
+    cantidad_fragmentos, cantidad_tareas = migrar_desde_archivo()
+    print(
+        f"Migración completada: {cantidad_tareas} tareas repartidas en "
+        f"{cantidad_fragmentos} archivos en {Rutas.TAREAS_FRAGMENTOS}."
+    )
@@ -0,0 +1,50 @@
+"""
+Operaciones de modificación de tareas.
+
+Las modificaciones se representan como registros (OperacionTarea) que los
+motores de almacenamiento aplican en lote. Este módulo permite reproducirlas
+sobre una lista de tareas en memoria (diario, fragmentos por usuario).
+"""
+
+from src.definiciones.schemas import OperacionTarea, Tarea
+
+
+def reproducir_operaciones(
+    tareas: list[Tarea], operaciones: list[OperacionTarea]
+) -> list[Tarea]:
+    """
+    Aplica (en orden) las operaciones sobre las tareas y retorna una nueva
+    lista. Las tareas recibidas no se modifican. Las operaciones no son
+    idempotentes (Ej. eliminar las finalizadas y luego finalizar otra tarea),
+    por lo que cada una debe reproducirse una única vez.
+    """
+    por_id = {t["id"]: t for t in tareas}
+
+    for operacion in operaciones:
+        match operacion["op"]:
+            case "crear":
+                tarea = operacion["tarea"]
+                por_id[tarea["id"]] = tarea
+            case "estado":
+                for id_tarea in operacion["ids"]:
+                    tarea = por_id.get(id_tarea)
+                    if tarea is not None:
+                        por_id[id_tarea] = {
+                            **tarea,
+                            "estado": operacion["estado"],
+                        }
+            case "eliminar":
+                for id_tarea in operacion["ids"]:
+                    por_id.pop(id_tarea, None)
+            case "eliminar_finalizadas":
+                id_usuario = operacion["id_usuario"]
+                por_id = {
+                    id_tarea: t
+                    for id_tarea, t in por_id.items()
+                    if not (
+                        t["id_usuario"] == id_usuario
+                        and t["estado"] == "Finalizada"
+                    )
+                }
+
+    return list(por_id.values())
@@ -0,0 +1,196 @@
+"""
+Motor de almacenamiento basado en SQLite.
+
+Almacena usuarios y tareas en una base de datos SQLite (Rutas.BASE_DATOS)
+con índices sobre las columnas consultadas por la aplicación, de modo que
+el inicio de sesión y el cambio de estado no dependan del total de
+registros. Incluye la migración desde el motor de archivos:
+
+    python -m src.motores.sqlite
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from functools import cache
+
+import src.lib.archivos as gestor
+import src.motores.archivo as motor_archivo
+from src.definiciones.constantes import Rutas
+from src.definiciones.schemas import OperacionTarea, Tarea, Usuario
+
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    id TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    nombre_usuario TEXT NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_usuarios_nombre_usuario
+    ON usuarios (nombre_usuario);
+
+CREATE TABLE IF NOT EXISTS tareas (
+    id TEXT NOT NULL,
+    id_usuario TEXT NOT NULL,
+    fecha_creacion TEXT NOT NULL,
+    fecha_vencimiento TEXT,
+    titulo TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    estado TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tareas_id ON tareas (id);
+CREATE INDEX IF NOT EXISTS idx_tareas_usuario_estado
+    ON tareas (id_usuario, estado);
+"""
+
+COLUMNAS_TAREA = (
+    "id",
+    "id_usuario",
+    "fecha_creacion",
+    "fecha_vencimiento",
+    "titulo",
+    "categoria",
+    "estado",
+)
+
+
+@cache
+def _conexion() -> sqlite3.Connection:
+    """Abre (una única vez) la conexión y crea el esquema si no existe."""
+    gestor.crear_directorio(Rutas.BASE_DATOS)
+    conexion = sqlite3.connect(Rutas.BASE_DATOS, timeout=30)
+    conexion.row_factory = sqlite3.Row
+    conexion.execute("PRAGMA journal_mode = WAL")
+    conexion.execute("PRAGMA synchronous = NORMAL")
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+def buscar_usuario(nombre_usuario: str) -> Usuario | None:
+    """Busca un usuario registrado (mediante nombre de usuario)."""
+    fila = (
+        _conexion()
+        .execute(
+            "SELECT id, nombre, nombre_usuario, hash FROM usuarios "
+            "WHERE nombre_usuario = ?",
+            (nombre_usuario,),
+        )
+        .fetchone()
+    )
+    return dict(fila) if fila else None
+
+
+def crear_usuario(usuario: Usuario) -> bool:
+    """Crea un usuario en la base de datos. Retorna False si ya existía."""
+    try:
+        with _conexion() as conexion:
+            conexion.execute(
+                "INSERT INTO usuarios (id, nombre, nombre_usuario, hash) "
+                "VALUES (:id, :nombre, :nombre_usuario, :hash)",
+                usuario,
+            )
+        return True
+    except sqlite3.IntegrityError:
+        return False
+
+
+def obtener_usuarios() -> list[Usuario]:
+    """Obtiene todos los usuarios registrados."""
+    filas = _conexion().execute(
+        "SELECT id, nombre, nombre_usuario, hash FROM usuarios"
+    )
+    return [dict(fila) for fila in filas]
+
+
+def obtener_tareas() -> Iterator[Tarea]:
+    """Recorre (sin cargarlas todas en memoria) las tareas de la base."""
+    filas = _conexion().execute(
+        f"SELECT {', '.join(COLUMNAS_TAREA)} FROM tareas ORDER BY rowid"
+    )
+    return (dict(fila) for fila in filas)
+
+
+def obtener_tareas_usuario(id_usuario: str) -> list[Tarea]:
+    """Obtiene las tareas de un usuario mediante el id_usuario."""
+    filas = _conexion().execute(
+        f"SELECT {', '.join(COLUMNAS_TAREA)} FROM tareas "
+        "WHERE id_usuario = ? ORDER BY rowid",
+        (id_usuario,),
+    )
+    return [dict(fila) for fila in filas]
+
+
+def aplicar_operaciones(operaciones: list[OperacionTarea]):
+    """Aplica las operaciones en una única transacción."""
+    with _conexion() as conexion:
+        for operacion in operaciones:
+            match operacion["op"]:
+                case "crear":
+                    _insertar_tareas(conexion, [operacion["tarea"]])
+                case "estado":
+                    estado, id_usuario = (
+                        operacion["estado"],
+                        operacion["id_usuario"],
+                    )
+                    conexion.executemany(
+                        "UPDATE tareas SET estado = ? "
+                        "WHERE id = ? AND id_usuario = ?",
+                        [(estado, i, id_usuario) for i in operacion["ids"]],
+                    )
+                case "eliminar":
+                    id_usuario = operacion["id_usuario"]
+                    conexion.executemany(
+                        "DELETE FROM tareas WHERE id = ? AND id_usuario = ?",
+                        [(i, id_usuario) for i in operacion["ids"]],
+                    )
+                case "eliminar_finalizadas":
+                    conexion.execute(
+                        "DELETE FROM tareas "
+                        "WHERE id_usuario = ? AND estado = 'Finalizada'",
+                        (operacion["id_usuario"],),
+                    )
+
+
+def migrar_desde_archivos() -> tuple[int, int]:
+    """
+    Copia los usuarios y tareas del motor de archivos a la base de datos.
+    Los registros ya existentes (mismo id) se omiten, por lo que la
+    migración puede repetirse sin duplicar datos. Retorna la cantidad de
+    usuarios y tareas leídas.
+    """
+    usuarios: list[Usuario] = gestor.leer_csv(Rutas.USUARIOS)
+    tareas = motor_archivo.obtener_tareas()
+
+    with _conexion() as conexion:
+        conexion.executemany(
+            "INSERT OR IGNORE INTO usuarios (id, nombre, nombre_usuario, hash) "
+            "VALUES (:id, :nombre, :nombre_usuario, :hash)",
+            usuarios,
+        )
+        _insertar_tareas(conexion, tareas, ignorar_existentes=True)
+
+    return (len(usuarios), len(tareas))
+
+
+def _insertar_tareas(
+    conexion: sqlite3.Connection,
+    tareas: list[Tarea],
+    ignorar_existentes: bool = False,
+):
+    """Inserta varias tareas usando la conexión (transacción) indicada."""
+    columnas = ", ".join(COLUMNAS_TAREA)
+    valores = ", ".join(f":{c}" for c in COLUMNAS_TAREA)
+    conflicto = " OR IGNORE" if ignorar_existentes else ""
+    conexion.executemany(
+        f"INSERT{conflicto} INTO tareas ({columnas}) VALUES ({valores})",
+        tareas,
+    )
+
+
+if __name__ == "__main__":
+    cantidad_usuarios, cantidad_tareas = migrar_desde_archivos()
+    print(
+        f"Migración completada: {cantidad_usuarios} usuarios y "
+        f"{cantidad_tareas} tareas leídas desde {Rutas.USUARIOS} y "
+        f"{Rutas.TAREAS}."
+    )
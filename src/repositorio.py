@@ -4,63 +4,176 @@ Módulo de Persistencia de Datos.
 Módulo que actúa como la Capa de Acceso a Datos (DAL), encargándose de la
 comunicación con el sistema de almacenamiento. Centraliza las consultas,
 el filtrado y el registro de la información de la aplicación.
+
+Cada función delega en el motor de almacenamiento configurado en
+`Config.MOTOR_DATOS` (ver src/motores). Las modificaciones de tareas se
+envían al motor como operaciones (OperacionTarea), lo que permite agruparlas
+en una única escritura mediante `unidad_de_trabajo`.
+
+Las tareas archivadas se almacenan fuera del motor, en un archivo JSON Lines
+por usuario (Rutas.ARCHIVO_TAREAS) al que solo se agregan registros, y que
+no se lee al iniciar sesión.
 """
 
+import importlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
 import src.lib.archivos as gestor
-from src.definiciones.constantes import Rutas
-from src.definiciones.schemas import EstadoTarea, Tarea, Usuario
+from src.definiciones.constantes import Config, Rutas
+from src.definiciones.schemas import (
+    EstadoTarea,
+    OperacionTarea,
+    Tarea,
+    Usuario,
+)
+
+
+# Módulo de cada motor. Solo se importa el motor configurado (Ej. sqlite3
+# no se carga si no se utiliza el motor "sqlite")
+MOTORES = {
+    "archivo": "src.motores.archivo",
+    "fragmentado": "src.motores.fragmentado",
+    "sqlite": "src.motores.sqlite",
+}
+
+# Operaciones pendientes de la unidad de trabajo activa (si existe)
+_lotes: list[list[OperacionTarea]] = []
+# Tareas por archivar (por id_usuario) de la unidad de trabajo activa
+_por_archivar: dict[str, list[Tarea]] = {}
+
+
+def _motor():
+    """Retorna el módulo del motor de almacenamiento configurado."""
+    return importlib.import_module(MOTORES[Config.MOTOR_DATOS])
+
+
+def _aplicar(operacion: OperacionTarea):
+    """Aplica una operación, o la agrega a la unidad de trabajo activa."""
+    if _lotes:
+        _lotes[-1].append(operacion)
+    else:
+        _motor().aplicar_operaciones([operacion])
+
+
+@contextmanager
+def unidad_de_trabajo():
+    """
+    Agrupa las modificaciones de tareas realizadas dentro del bloque y las
+    persiste en una única escritura al salir (después de agregar al archivo
+    las tareas archivadas). Si ocurre un error, las modificaciones y tareas
+    por archivar pendientes se descartan (servicios.unidad_de_trabajo
+    revierte además los cambios en memoria de la sesión). Las unidades
+    anidadas se integran en la unidad externa. Nota: *las consultas
+    realizadas dentro del bloque no ven las modificaciones pendientes*.
+    """
+    if _lotes:
+        yield
+        return
+
+    _lotes.append([])
+    try:
+        yield
+        operaciones = _lotes[-1]
+        por_archivar = dict(_por_archivar)
+    finally:
+        _lotes.pop()
+        _por_archivar.clear()
+
+    for id_usuario, tareas in por_archivar.items():
+        gestor.agregar_json_lineas(_ruta_archivo(id_usuario), tareas)
+    if operaciones:
+        _motor().aplicar_operaciones(operaciones)
 
 
 def buscar_usuario(nombre_usuario: str) -> Usuario | None:
     """Busca un usuario registrado (mediante nombre de usuario)."""
-    usuarios: list[Usuario] = gestor.leer_csv(Rutas.USUARIOS)
-    return next(
-        (u for u in usuarios if (u["nombre_usuario"] == nombre_usuario)), None
-    )
+    return _motor().buscar_usuario(nombre_usuario)
 
 
-def crear_usuario(usuario: Usuario):
+def crear_usuario(usuario: Usuario) -> bool:
     """
-    Crea un usuario en el sistema de almacenamiento. Nota: *Esta función
-    se ejecuta después de haber intentado iniciar sesión, por lo tanto
-    ya se ha validado que el usuario no existe (evitar duplicados)*.
+    Crea un usuario en el sistema de almacenamiento. Retorna False si el
+    nombre de usuario ya estaba registrado (Ej. por otra sesión en paralelo).
     """
-    usuarios: list[Usuario] = gestor.leer_csv(Rutas.USUARIOS)
-    usuarios.append(usuario)
-    encabezados = list(usuario.keys())
-    gestor.guardar_csv(Rutas.USUARIOS, encabezados, usuarios)
+    return _motor().crear_usuario(usuario)
+
+
+def obtener_usuarios() -> list[Usuario]:
+    """Obtiene todos los usuarios registrados."""
+    return _motor().obtener_usuarios()
 
 
 def crear_tarea(tarea: Tarea):
     """Crea una tarea en el sistema de almacenamiento."""
-    tareas: list[Tarea] = gestor.leer_json(Rutas.TAREAS) or []
-    tareas.append(tarea)
-    gestor.guardar_json(Rutas.TAREAS, tareas)
+    _aplicar({"op": "crear", "tarea": dict(tarea)})
 
 
 def obtener_tareas_usuario(id_usuario: str) -> list[Tarea]:
     """Obtiene las tareas de un usuario mediante el id_usuario."""
-    tareas: list[Tarea] = gestor.leer_json(Rutas.TAREAS) or []
-    tareas_usuario = [t for t in tareas if t["id_usuario"] == id_usuario]
-    return tareas_usuario
+    return _motor().obtener_tareas_usuario(id_usuario)
+
+
+def obtener_tareas() -> Iterable[Tarea]:
+    """
+    Recorre las tareas de todos los usuarios (solo lectura), en una única
+    pasada sobre el almacenamiento.
+    """
+    return _motor().obtener_tareas()
 
 
 def eliminar_tareas_finalizadas(id_usuario: str):
     """Elimina las tareas finalizadas de un usuario."""
-    tareas: list[Tarea] = gestor.leer_json(Rutas.TAREAS) or []
-    filtradas = [
-        t
-        for t in tareas
-        if not (t["id_usuario"] == id_usuario and t["estado"] == "Finalizada")
-    ]
-    gestor.guardar_json(Rutas.TAREAS, filtradas)
-
-
-def cambiar_estado_tarea(id_tarea: str, nuevo_estado: EstadoTarea):
-    """Cambia el estado de una tarea."""
-    tareas: list[Tarea] = gestor.leer_json(Rutas.TAREAS) or []
-    actualizadas = [
-        {**tarea, "estado": nuevo_estado} if tarea["id"] == id_tarea else tarea
-        for tarea in tareas
-    ]
-    gestor.guardar_json(Rutas.TAREAS, actualizadas)
+    _aplicar({"op": "eliminar_finalizadas", "id_usuario": id_usuario})
+
+
+def cambiar_estado_tarea(
+    id_tarea: str, nuevo_estado: EstadoTarea, id_usuario: str
+):
+    """Cambia el estado de una tarea (perteneciente al usuario indicado)."""
+    cambiar_estado_tareas([id_tarea], nuevo_estado, id_usuario)
+
+
+def cambiar_estado_tareas(
+    ids_tareas: list[str], nuevo_estado: EstadoTarea, id_usuario: str
+):
+    """Cambia el estado de varias tareas de un usuario en una operación."""
+    _aplicar(
+        {
+            "op": "estado",
+            "ids": ids_tareas,
+            "estado": nuevo_estado,
+            "id_usuario": id_usuario,
+        }
+    )
+
+
+def archivar_tareas(tareas: list[Tarea], id_usuario: str):
+    """
+    Mueve tareas de un usuario al archivo: primero se agregan al archivo y
+    luego se eliminan del almacenamiento principal (una interrupción entre
+    ambos pasos deja la tarea duplicada, pero nunca la pierde). Dentro de una
+    unidad de trabajo, ambos pasos se realizan al confirmarla.
+    """
+    archivadas = [dict(t) for t in tareas]
+    if _lotes:
+        _por_archivar.setdefault(id_usuario, []).extend(archivadas)
+    else:
+        gestor.agregar_json_lineas(_ruta_archivo(id_usuario), archivadas)
+    _aplicar(
+        {
+            "op": "eliminar",
+            "ids": [t["id"] for t in tareas],
+            "id_usuario": id_usuario,
+        }
+    )
+
+
+def obtener_tareas_archivadas(id_usuario: str) -> Iterator[Tarea]:
+    """Recorre (sin cargarlas todas en memoria) las tareas archivadas."""
+    return gestor.iterar_json_lineas(_ruta_archivo(id_usuario))
+
+
+def _ruta_archivo(id_usuario: str) -> str:
+    """Retorna la ruta del archivo de tareas archivadas de un usuario."""
+    return f"{Rutas.ARCHIVO_TAREAS}{id_usuario}.jsonl"
@@ -4,22 +4,42 @@ Módulo de Servicios (Capa de Lógica de Negocio)
 Este módulo contiene las funciones core de la aplicación, encargándose de
 procesar la información y aplicar las reglas de negocio antes de la
 persistencia de datos.
+
+Los ejecutores de concurrent.futures (solo usados al exportar) se importan
+dentro de las funciones de exportación, ya que su importación es costosa.
 """
 
 import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date
+from functools import partial
+from itertools import chain
+from pathlib import Path
 
 import src.lib.archivos as gestor
 import src.repositorio as repo
 import src.utils as utils
-from src.definiciones.constantes import Rutas
+from src.definiciones.constantes import Limites, Rutas
 from src.definiciones.schemas import (
+    CAMPOS_TAREA,
     EstadoGlobal,
     EstadoTarea,
     Extension,
+    Resumen,
     Tarea,
+    TareaCompacta,
     Usuario,
 )
+from src.indices import IndiceTareas
+
+
+ESTADOS: list[EstadoTarea] = ["Pendiente", "En proceso", "Finalizada"]
+
+NOMBRE_MANIFIESTO = "manifiesto.json"
+CARPETA_BLOQUES = "web/datos"
 
 
 def login(nombre_usuario: str, clave: str) -> str | EstadoGlobal:
@@ -32,8 +52,11 @@ def login(nombre_usuario: str, clave: str) -> str | EstadoGlobal:
     if utils.generar_hash(clave) != usuario["hash"]:
         return "error:Clave incorrecta."
 
-    tareas = repo.obtener_tareas_usuario(usuario["id"])
-    return {"usuario": usuario, "tareas": tareas}
+    tareas = [
+        TareaCompacta(t) for t in repo.obtener_tareas_usuario(usuario["id"])
+    ]
+    indice = IndiceTareas(tareas)
+    return {"usuario": usuario, "tareas": tareas, "indice": indice}
 
 
 def crear_usuario(
@@ -51,12 +74,21 @@ def crear_usuario(
         "nombre_usuario": nombre_usuario.lower(),
         "hash": utils.generar_hash(clave),
     }
-    repo.crear_usuario(nuevo_usuario)
-    return {"usuario": nuevo_usuario, "tareas": []}
+    if not repo.crear_usuario(nuevo_usuario):
+        return "error:El usuario ya se encuentra registrado"
+    return {"usuario": nuevo_usuario, "tareas": [], "indice": IndiceTareas()}
 
 
-def crear_tarea(tareas: list[Tarea], form, usuario: Usuario) -> str:
-    """Crea una tarea a partir de los datos ingresados por el usuario."""
+def crear_tarea(
+    tareas: list[Tarea],
+    form,
+    usuario: Usuario,
+    indice: IndiceTareas | None = None,
+) -> str:
+    """
+    Crea una tarea a partir de los datos ingresados por el usuario (y la
+    agrega al índice de búsqueda, si se indica).
+    """
     nueva_tarea: Tarea = {
         "id": utils.generar_id(),
         "id_usuario": usuario["id"],
@@ -70,11 +102,67 @@ def crear_tarea(tareas: list[Tarea], form, usuario: Usuario) -> str:
     }
 
     repo.crear_tarea(nueva_tarea)
-    tareas.append(nueva_tarea)
+    tarea = TareaCompacta(nueva_tarea)
+    tareas.append(tarea)
+    if indice is not None:
+        indice.agregar(tarea)
     return "ok:Tarea agregada exitosamente."
 
 
-def eliminar_finalizadas(tareas: list[Tarea], usuario: Usuario) -> str:
+def importar_tareas(
+    tareas: list[Tarea],
+    ruta: str,
+    usuario: Usuario,
+    indice: IndiceTareas | None = None,
+) -> str:
+    """
+    Importa tareas desde un archivo .csv, .json o .ndjson (opcionalmente
+    comprimido con gzip: .csv.gz, .json.gz, .ndjson.gz), como los generados
+    al exportar. Cada registro debe tener titulo y categoria, y
+    opcionalmente fecha_vencimiento (dd-mm-aaaa) y estado. Si algún registro
+    no es válido no se importa ninguno; las tareas válidas se guardan en una
+    única escritura.
+    """
+    if not Path(ruta).is_file():
+        return f"error:No se encontró el archivo {ruta}"
+
+    try:
+        registros = _leer_registros(ruta)
+    except (OSError, EOFError, UnicodeDecodeError):
+        return f"error:No se pudo leer el archivo {ruta}"
+    if registros is None:
+        return "error:Formato no soportado. Use .csv, .json o .ndjson (.gz)"
+    if not registros:
+        return "info:El archivo no contiene tareas."
+
+    for numero, registro in enumerate(registros, 1):
+        error = _validar_registro(registro)
+        if error:
+            return f"error:Registro {numero}: {error}"
+
+    por_estado: dict[int, list[Tarea]] = defaultdict(list)
+    with unidad_de_trabajo(tareas, indice):
+        for registro in registros:
+            form = {
+                "titulo": registro["titulo"],
+                "categoria": registro["categoria"],
+                "fecha_vencimiento": registro.get("fecha_vencimiento") or "-",
+            }
+            crear_tarea(tareas, form, usuario, indice)
+            estado = registro.get("estado") or "Pendiente"
+            if estado != "Pendiente":
+                por_estado[ESTADOS.index(estado) + 1].append(tareas[-1])
+        for estado, seleccionadas in por_estado.items():
+            cambiar_estado_tareas(seleccionadas, estado, indice)
+
+    cantidad_tareas = len(registros)
+    palabras = ("han", "tareas") if cantidad_tareas > 1 else ("ha", "tarea")
+    return f"ok:Se {palabras[0]} importado {cantidad_tareas} {palabras[1]}"
+
+
+def eliminar_finalizadas(
+    tareas: list[Tarea], usuario: Usuario, indice: IndiceTareas | None = None
+) -> str:
     """Elimina las tareas con estado 'Finalizada' asociadas a un id_usuario."""
     indices_finalizadas = sorted(
         [
@@ -88,26 +176,158 @@ def eliminar_finalizadas(tareas: list[Tarea], usuario: Usuario) -> str:
 
     repo.eliminar_tareas_finalizadas(usuario["id"])
     palabras = ("han", "tareas") if cantidad_tareas > 1 else ("ha", "tarea")
-    for i in indices_finalizadas:
-        tareas.pop(i)
+    eliminadas = [tareas.pop(i) for i in indices_finalizadas]
+    if indice is not None:
+        indice.quitar(eliminadas, tareas)
     return f"ok:Se {palabras[0]} eliminado {cantidad_tareas} {palabras[1]}"
 
 
-def cambiar_estado_tarea(
-    tareas: list[Tarea], tarea: Tarea, estado: int
+def archivar_tareas(
+    tareas: list[Tarea],
+    usuario: Usuario,
+    dias: int | None = None,
+    indice: IndiceTareas | None = None,
 ) -> str:
-    """Cambia el estado de una única tarea."""
-    estados: list[EstadoTarea] = ["Pendiente", "En proceso", "Finalizada"]
-    nuevo_estado = estados[estado - 1]
+    """
+    Mueve al archivo del usuario las tareas finalizadas o, si se indica
+    `dias`, las tareas creadas hace más de esa cantidad de días. Las tareas
+    archivadas se quitan del listado de la sesión.
+    """
+    if dias is None:
+        a_archivar = [t for t in tareas if t["estado"] == "Finalizada"]
+    else:
+        hoy = date.today().toordinal()
+        a_archivar = [
+            t
+            for t in tareas
+            if -utils.dias_desde_hoy(t["fecha_creacion"], hoy) > dias
+        ]
+    cantidad_tareas = len(a_archivar)
+
+    if not cantidad_tareas:
+        return "info:No hay tareas para archivar."
+
+    repo.archivar_tareas(a_archivar, usuario["id"])
+    archivadas = {id(t) for t in a_archivar}
+    tareas[:] = [t for t in tareas if id(t) not in archivadas]
+    if indice is not None:
+        indice.quitar(a_archivar, tareas)
+    palabras = ("han", "tareas") if cantidad_tareas > 1 else ("ha", "tarea")
+    return f"ok:Se {palabras[0]} archivado {cantidad_tareas} {palabras[1]}"
 
-    if tarea["estado"] == nuevo_estado:
+
+def obtener_tareas_archivadas(usuario: Usuario) -> list[TareaCompacta]:
+    """Obtiene las tareas archivadas de un usuario (no se cargan al login)."""
+    return [
+        TareaCompacta(t) for t in repo.obtener_tareas_archivadas(usuario["id"])
+    ]
+
+
+def cambiar_estado_tareas(
+    seleccionadas: list[Tarea], estado: int, indice: IndiceTareas | None = None
+) -> str:
+    """
+    Cambia el estado de varias tareas (de un mismo usuario) y lo persiste
+    en una única escritura.
+    """
+    nuevo_estado = ESTADOS[estado - 1]
+    a_modificar = [t for t in seleccionadas if t["estado"] != nuevo_estado]
+    cantidad_tareas = len(a_modificar)
+
+    if not cantidad_tareas:
         return "info:El estado no ha sido modificado."
 
-    repo.cambiar_estado_tarea(tarea["id"], nuevo_estado)
-    for t in tareas:
-        if t["id"] == tarea["id"]:
-            t["estado"] = nuevo_estado
-    return "ok:Tarea modificada exitosamente."
+    repo.cambiar_estado_tareas(
+        [t["id"] for t in a_modificar],
+        nuevo_estado,
+        a_modificar[0]["id_usuario"],
+    )
+    for tarea in a_modificar:
+        estado_anterior, tarea["estado"] = tarea["estado"], nuevo_estado
+        if indice is not None:
+            indice.cambiar_estado(tarea, estado_anterior)
+    palabras = ("han", "tareas") if cantidad_tareas > 1 else ("ha", "tarea")
+    return f"ok:Se {palabras[0]} modificado {cantidad_tareas} {palabras[1]}"
+
+
+def buscar_tareas(
+    indice: IndiceTareas, texto: str, categoria: str, estado: int
+) -> list[int]:
+    """
+    Busca tareas por palabras del título y categorías (sin distinguir
+    mayúsculas ni tildes) y filtra por estado (0 = todos). Retorna las
+    posiciones de las tareas en el listado de la sesión.
+    """
+    return indice.buscar(
+        texto, categoria, ESTADOS[estado - 1] if estado else None
+    )
+
+
+def obtener_resumen(indice: IndiceTareas) -> Resumen:
+    """
+    Obtiene el resumen de las tareas de la sesión (por estado, vigencia y
+    categorías más frecuentes) desde los contadores del índice.
+    """
+    return indice.resumen()
+
+
+def filtrar_por_vencimiento(
+    indice: IndiceTareas, vista: int, dias: int = 0
+) -> list[int]:
+    """
+    Obtiene (ordenadas por fecha límite) las posiciones de las tareas no
+    finalizadas según la vista: 1=Atrasadas, 2=Vencen hoy, 3=Vencen dentro
+    de los próximos `dias` días (incluido hoy).
+    """
+    hoy = date.today().toordinal()
+    match vista:
+        case 1:
+            return indice.por_vencimiento(hasta=hoy - 1)
+        case 2:
+            return indice.por_vencimiento(hoy, hoy)
+        case _:
+            return indice.por_vencimiento(hoy, hoy + dias)
+
+
+def ordenar_tareas(indice: IndiceTareas, criterio: int) -> list[int]:
+    """
+    Obtiene las posiciones de las tareas ordenadas por 1=Fecha límite o
+    2=Fecha de creación.
+    """
+    campo = "fecha_vencimiento" if criterio == 1 else "fecha_creacion"
+    return indice.ordenadas_por(campo)
+
+
+@contextmanager
+def unidad_de_trabajo(
+    tareas: list[Tarea], indice: IndiceTareas | None = None
+) -> Iterator[None]:
+    """
+    Agrupa varias operaciones de servicios en una única escritura:
+
+        with servicios.unidad_de_trabajo(tareas, indice):
+            servicios.crear_tarea(tareas, form, usuario, indice)
+            servicios.cambiar_estado_tareas(seleccionadas, 3, indice)
+
+    Los servicios modifican el listado de la sesión (y el índice) de
+    inmediato, pero la escritura ocurre al salir del bloque. Si ocurre un
+    error (dentro del bloque o al escribir), las modificaciones pendientes
+    se descartan y el listado, el estado de sus tareas y el índice vuelven
+    a como estaban antes del bloque, por lo que la sesión sigue
+    coincidiendo con lo almacenado.
+    """
+    previas = list(tareas)
+    estados = [t["estado"] for t in previas]
+    try:
+        with repo.unidad_de_trabajo():
+            yield
+    except BaseException:
+        for tarea, estado in zip(previas, estados, strict=True):
+            tarea["estado"] = estado
+        tareas[:] = previas
+        if indice is not None:
+            indice.reconstruir(tareas)
+        raise
 
 
 def exportar_tareas(
@@ -116,35 +336,292 @@ def exportar_tareas(
     carpeta: str,
     abrir_web: bool,
 ) -> str:
-    """Exporta los datos en los formatos especificados."""
+    """
+    Exporta los datos en los formatos especificados. Cada formato se escribe
+    en paralelo (un hilo por formato) y recorre las tareas mediante
+    generadores, sin construir copias completas de los datos en memoria.
+
+    La exportación es incremental: en la carpeta de destino se guarda un
+    manifiesto con la huella de los datos usados en cada archivo generado, y
+    solo se reescriben los archivos cuyos datos cambiaron desde la
+    exportación anterior (o que ya no existen).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
     if not extensiones:
         return "error:No seleccionó ningún formato."
 
     ruta_base = f"{Rutas.EXPORTACIONES}{carpeta}"
+    ruta_manifiesto = f"{ruta_base}/{NOMBRE_MANIFIESTO}"
+    previo = gestor.leer_json(ruta_manifiesto) or {}
+    salidas_previas: dict[str, str] = previo.get("salidas", {})
+
+    huellas = [_huella_tarea(t) for t in tareas]
+    huella_tareas = utils.generar_huella(huellas)
+    salidas = {
+        salida: huella
+        for salida, huella in salidas_previas.items()
+        if Path(f"{ruta_base}/{salida}").exists()
+    }
+    # Si falta algún bloque de la exportación web, se vuelve a generar (con
+    # main.js) aunque las tareas no hayan cambiado
+    if any(
+        salida.startswith(CARPETA_BLOQUES) and salida not in salidas
+        for salida in salidas_previas
+    ):
+        salidas.pop("web/main.js", None)
 
-    if ".csv" in extensiones:
-        encabezados = list(tareas[0].keys())
-        gestor.guardar_csv(f"{ruta_base}/tareas.csv", encabezados, tareas)
+    exportadores = {
+        ".csv": ("tareas.csv", _exportar_csv, huella_tareas),
+        ".json": ("tareas.json", _exportar_json, huella_tareas),
+        ".ndjson": ("tareas.ndjson", _exportar_ndjson, huella_tareas),
+        ".csv.gz": (
+            "tareas.csv.gz",
+            partial(_exportar_csv, comprimir=True),
+            huella_tareas,
+        ),
+        ".ndjson.gz": (
+            "tareas.ndjson.gz",
+            partial(_exportar_ndjson, comprimir=True),
+            huella_tareas,
+        ),
+        # La vigencia (web) depende también de la fecha actual
+        ".html": (
+            "web/main.js",
+            partial(_exportar_web, huellas=huellas, salidas=salidas),
+            utils.generar_huella([huella_tareas, date.today().isoformat()]),
+        ),
+    }
+    pendientes = [
+        (salida, exportar, huella)
+        for extension, (salida, exportar, huella) in exportadores.items()
+        if extension in extensiones and salidas.get(salida) != huella
+    ]
 
-    if ".json" in extensiones:
-        gestor.guardar_json(f"{ruta_base}/tareas.json", tareas)
+    with ThreadPoolExecutor(max_workers=len(pendientes) or 1) as ejecutor:
+        trabajos = [
+            ejecutor.submit(exportar, tareas, ruta_base)
+            for _, exportar, _ in pendientes
+        ]
+        for trabajo in trabajos:
+            trabajo.result()
+    salidas.update({salida: huella for salida, _, huella in pendientes})
 
     if ".html" in extensiones:
-        a_exportar = [
-            {
-                **t,
-                "vigencia": utils.estilar_vigencia_tarea(
-                    t["fecha_vencimiento"], t["estado"]
-                ),
-            }
-            for t in tareas
-        ]
-        tareas_json = json.dumps(a_exportar, indent=4, ensure_ascii=False)
-        contenido = f"const tareas = {tareas_json};"
-        gestor.guardar_texto_plano(f"{ruta_base}/web/main.js", contenido)
-        gestor.copiar_archivo(Rutas.PLANTILLA, f"{ruta_base}/web")
-        gestor.copiar_archivo(Rutas.FAVICON, f"{ruta_base}/web")
+        for ruta_recurso in (Rutas.PLANTILLA, Rutas.FAVICON):
+            _copiar_si_cambio(ruta_recurso, ruta_base, "web", salidas)
         if abrir_web:
             utils.abrir_navegador(f"{ruta_base}/web/index.html")
 
+    manifiesto = {"salidas": salidas}
+    if manifiesto != previo:
+        gestor.guardar_json(ruta_manifiesto, manifiesto, bloqueo=False)
+
+    if not pendientes:
+        return f"info:No hubo cambios en los datos de [blue]{ruta_base}[/blue]"
     return f"ok:Datos exportados exitosamente en [blue]{ruta_base}[/blue]"
+
+
+def exportar_todos(
+    extensiones: tuple[Extension, ...],
+) -> Iterator[tuple[str, int, float]]:
+    """
+    Exporta las tareas de todos los usuarios (respaldo y reportes) en
+    exportaciones/<nombre_usuario>/. Las tareas se reparten por usuario en
+    una única pasada, y cada usuario se exporta en un proceso distinto (uno
+    por núcleo disponible), comenzando por los que tienen más tareas.
+    Retorna, a medida que terminan, el nombre de usuario, la cantidad de
+    tareas y los segundos utilizados.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    nombres = {u["id"]: u["nombre_usuario"] for u in repo.obtener_usuarios()}
+    por_usuario: dict[str, list[Tarea]] = defaultdict(list)
+    for tarea in repo.obtener_tareas():
+        por_usuario[tarea["id_usuario"]].append(dict(tarea))
+
+    with ProcessPoolExecutor() as ejecutor:
+        trabajos = {}
+        for id_usuario, tareas in sorted(
+            por_usuario.items(), key=lambda par: len(par[1]), reverse=True
+        ):
+            nombre_usuario = nombres.get(id_usuario, id_usuario)
+            trabajo = ejecutor.submit(
+                _exportar_usuario, tareas, extensiones, nombre_usuario
+            )
+            trabajos[trabajo] = (nombre_usuario, len(tareas))
+
+        for trabajo in as_completed(trabajos):
+            nombre_usuario, cantidad = trabajos[trabajo]
+            yield nombre_usuario, cantidad, trabajo.result()
+
+
+def _exportar_usuario(
+    tareas: list[Tarea], extensiones: tuple[Extension, ...], carpeta: str
+) -> float:
+    """Exporta las tareas de un usuario y retorna los segundos utilizados."""
+    inicio = time.perf_counter()
+    exportar_tareas(tareas, extensiones, carpeta, False)
+    return time.perf_counter() - inicio
+
+
+def _leer_registros(ruta: str) -> list[dict] | None:
+    """
+    Lee los registros de un archivo a importar según su extensión. Retorna
+    None si el formato no es soportado.
+    """
+    nombre = ruta.lower()
+    if nombre.endswith((".ndjson", ".ndjson.gz")):
+        return list(gestor.iterar_json_lineas(ruta))
+    if nombre.endswith((".json", ".json.gz")):
+        datos = gestor.leer_json(ruta)
+        return datos if isinstance(datos, list) else None
+    if nombre.endswith((".csv", ".csv.gz")):
+        return gestor.leer_csv(ruta)
+    return None
+
+
+def _validar_registro(registro) -> str | None:
+    """Valida un registro a importar. Retorna el error o None si es válido."""
+    if not isinstance(registro, dict):
+        return "Debe ser un objeto con los campos de la tarea."
+
+    for campo in ("titulo", "categoria"):
+        valor = registro.get(campo)
+        if not isinstance(valor, str) or not 1 <= len(valor) <= 50:
+            return f"El campo {campo} debe contener entre 1 y 50 caracteres."
+
+    # Los registros JSON pueden contener valores de cualquier tipo (Ej. 5)
+    fecha = registro.get("fecha_vencimiento")
+    if fecha and fecha != "-":
+        error_fecha = f"Fecha límite inválida ({fecha}). Formato: dd-mm-aaaa"
+        if not isinstance(fecha, str):
+            return error_fecha
+        try:
+            utils.fecha_a_ordinal(fecha)
+        except ValueError:
+            return error_fecha
+
+    estado = registro.get("estado")
+    if estado and (not isinstance(estado, str) or estado not in ESTADOS):
+        return f"Estado inválido ({estado})."
+    return None
+
+
+def _huella_tarea(tarea: Tarea) -> str:
+    """Huella del contenido de una tarea (cambia si cambia algún campo)."""
+    return utils.generar_huella(str(tarea.get(c)) for c in CAMPOS_TAREA)
+
+
+def _copiar_si_cambio(
+    ruta_recurso: str, ruta_base: str, carpeta: str, salidas: dict[str, str]
+):
+    """
+    Copia un recurso (plantilla, favicon) a la carpeta de exportación solo
+    si cambió desde la exportación anterior, y registra su huella.
+    """
+    import hashlib
+
+    salida = f"{carpeta}/{Path(ruta_recurso).name}"
+    with open(ruta_recurso, "rb") as archivo:
+        huella = hashlib.blake2b(archivo.read(), digest_size=16).hexdigest()
+
+    if salidas.get(salida) != huella:
+        gestor.copiar_archivo(ruta_recurso, f"{ruta_base}/{carpeta}")
+        salidas[salida] = huella
+
+
+def _exportar_csv(
+    tareas: list[Tarea], ruta_base: str, comprimir: bool = False
+):
+    """Exporta las tareas en formato .csv (o .csv.gz)"""
+    encabezados = list(tareas[0].keys())
+    ruta = f"{ruta_base}/tareas.csv{'.gz' if comprimir else ''}"
+    gestor.guardar_csv(ruta, encabezados, iter(tareas), comprimir)
+
+
+def _exportar_json(tareas: list[Tarea], ruta_base: str):
+    """Exporta las tareas en formato .json"""
+    gestor.guardar_json_array(f"{ruta_base}/tareas.json", iter(tareas))
+
+
+def _exportar_ndjson(
+    tareas: list[Tarea], ruta_base: str, comprimir: bool = False
+):
+    """Exporta las tareas en formato .ndjson (o .ndjson.gz), una por línea"""
+    ruta = f"{ruta_base}/tareas.ndjson{'.gz' if comprimir else ''}"
+    gestor.guardar_json_lineas(ruta, map(dict, tareas), comprimir)
+
+
+def _exportar_web(
+    tareas: list[Tarea],
+    ruta_base: str,
+    huellas: list[str],
+    salidas: dict[str, str],
+):
+    """
+    Exporta las tareas en formato web. Las tareas se dividen en bloques de
+    tamaño fijo (web/datos/bloque-NNNN.js), que index.html carga solo cuando
+    los necesita, y main.js contiene únicamente el resumen: totales y
+    conteos por estado y categoría de cada bloque. Solo se reescriben los
+    bloques cuya huella cambió (registrándola en `salidas`) o cuyo archivo
+    no existe, y se eliminan los bloques que sobran de una exportación
+    anterior.
+    """
+    tamano = Limites.TAREAS_POR_BLOQUE
+    hoy = date.today().isoformat()
+    conteos_bloques: list[dict[str, dict[str, int]]] = []
+    vigentes: set[str] = set()
+
+    for numero, inicio in enumerate(range(0, len(tareas), tamano)):
+        bloque = tareas[inicio : inicio + tamano]
+        conteos: dict[str, dict[str, int]] = defaultdict(dict)
+        for t in bloque:
+            por_categoria = conteos[t["estado"]]
+            por_categoria[t["categoria"]] = (
+                por_categoria.get(t["categoria"], 0) + 1
+            )
+        conteos_bloques.append(conteos)
+
+        salida = f"{CARPETA_BLOQUES}/bloque-{numero:04}.js"
+        huellas_bloque = huellas[inicio : inicio + tamano]
+        huella = utils.generar_huella([*huellas_bloque, hoy])
+        ruta = f"{ruta_base}/{salida}"
+        vigentes.add(salida)
+        if salidas.get(salida) != huella or not Path(ruta).exists():
+            _exportar_bloque(bloque, numero, ruta)
+            salidas[salida] = huella
+
+    for salida in [s for s in salidas if s.startswith(CARPETA_BLOQUES)]:
+        if salida not in vigentes:
+            gestor.eliminar_archivo(f"{ruta_base}/{salida}")
+            del salidas[salida]
+
+    resumen = {
+        "total": len(tareas),
+        "tamano_bloque": tamano,
+        "bloques": conteos_bloques,
+    }
+    gestor.guardar_texto_plano(
+        f"{ruta_base}/web/main.js",
+        f"const resumen = {json.dumps(resumen, ensure_ascii=False)};",
+    )
+
+
+def _exportar_bloque(tareas: list[Tarea], numero: int, ruta: str):
+    """
+    Escribe un bloque de tareas (con su vigencia) como un script que las
+    entrega a index.html mediante cargarBloque(numero, tareas).
+    """
+    con_vigencia = (
+        {**t, "vigencia": vigencia}
+        for t, vigencia in zip(
+            tareas, utils.calcular_vigencias(tareas), strict=True
+        )
+    )
+    contenido = chain(
+        [f"cargarBloque({numero}, "],
+        gestor.serializar_json_array(con_vigencia),
+        [");"],
+    )
+    gestor.guardar_texto_plano(ruta, contenido)
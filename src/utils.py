@@ -3,20 +3,30 @@ Módulo de utilidades generales (Helpers).
 
 Módulo con funciones de apoyo para generar ids, obtener hash de clave,
 realizar ciertas operaciones, y dar formato a algunas salidas de texto.
+Los módulos hashlib, uuid y webbrowser se importan dentro de las funciones
+que los utilizan, para no retrasar el inicio de la aplicación.
 """
 
-import hashlib
-import uuid
-import webbrowser
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date
+from functools import cache
 from pathlib import Path
 
 import src.lib.consola as cli
-from src.definiciones.schemas import Campo, EstadoTarea, Menu, Tarea
+from src.definiciones.schemas import (
+    Campo,
+    EstadoTarea,
+    Menu,
+    Resumen,
+    Tarea,
+    Vigencia,
+)
 
 
 def abrir_navegador(ruta: str):
     """Abre el navegador web en la ruta indicada."""
+    import webbrowser
+
     try:
         path = Path(ruta).resolve().as_uri()
         exito = webbrowser.open(path)
@@ -26,15 +36,29 @@ def abrir_navegador(ruta: str):
         raise Exception("Error al abrir navegador.") from e
 
 
-def dias_desde_hoy(fecha: str) -> int:
-    """Cantidad de días entre la fecha indicada en formato dd-mm-aaaa y hoy."""
+@cache
+def fecha_a_ordinal(fecha: str) -> int:
+    """
+    Convierte una fecha en formato dd-mm-aaaa al ordinal del día. El
+    resultado se memoriza por texto, ya que muchas tareas comparten fecha.
+    """
     try:
-        fecha_formateada = date.strptime(fecha, "%d-%m-%Y")
-        return (fecha_formateada - date.today()).days
+        dia, mes, anio = fecha.split("-")
+        return date(int(anio), int(mes), int(dia)).toordinal()
     except ValueError as e:
         raise ValueError("Fecha con formato inválido.") from e
 
 
+def dias_desde_hoy(fecha: str, hoy: int | None = None) -> int:
+    """
+    Cantidad de días entre la fecha indicada en formato dd-mm-aaaa y hoy. Al
+    procesar varias tareas, `hoy` (ordinal) se calcula una única vez.
+    """
+    if hoy is None:
+        hoy = date.today().toordinal()
+    return fecha_a_ordinal(fecha) - hoy
+
+
 def estilar_estado_tarea(estado: EstadoTarea):
     """Agrega color al estado de la tarea para identificarlas fácilmente."""
     colors = {
@@ -45,21 +69,81 @@ def estilar_estado_tarea(estado: EstadoTarea):
     return f"[{colors[estado]}]{estado}[/]"
 
 
-def estilar_vigencia_tarea(fecha: str | None, estado: EstadoTarea) -> str:
+def estilar_vigencia_tarea(
+    fecha: str | None, estado: EstadoTarea, hoy: int | None = None
+) -> str:
     """Genera un texto en color para identificar la fecha límite de una tarea."""
     if fecha is None or estado == "Finalizada":
         return ""
+    return _estilar_vigencia(dias_desde_hoy(fecha, hoy))
 
-    dias = dias_desde_hoy(fecha)
-    palabra = "día" if abs(dias) == 1 else "días"
 
+def calcular_vigencias(tareas: Iterable[Tarea]) -> Iterator[str]:
+    """
+    Genera la vigencia de cada tarea (en el mismo orden), evaluando la fecha
+    actual una única vez para todo el lote.
+    """
+    hoy = date.today().toordinal()
+    return (
+        estilar_vigencia_tarea(t["fecha_vencimiento"], t["estado"], hoy)
+        for t in tareas
+    )
+
+
+def clasificar_vigencia(dias: int | None) -> Vigencia:
+    """Clasifica una tarea (no finalizada) según los días restantes."""
+    if dias is None:
+        return "Sin fecha límite"
     if dias < 0:
-        return f"[red]Atrasada ({abs(dias)} {palabra})[/]"
+        return "Atrasada"
     if dias == 0:
-        return "[yellow]Vence hoy[/]"
+        return "Vence hoy"
     if dias < 4:
-        return f"[blue]Vence pronto ({dias} {palabra})[/]"
-    return f"[green]A tiempo ({dias} {palabra})[/]"
+        return "Vence pronto"
+    return "A tiempo"
+
+
+@cache
+def _estilar_vigencia(dias: int) -> str:
+    """Texto en color de la vigencia según los días restantes."""
+    palabra = "día" if abs(dias) == 1 else "días"
+
+    match clasificar_vigencia(dias):
+        case "Atrasada":
+            return f"[red]Atrasada ({abs(dias)} {palabra})[/]"
+        case "Vence hoy":
+            return "[yellow]Vence hoy[/]"
+        case "Vence pronto":
+            return f"[blue]Vence pronto ({dias} {palabra})[/]"
+        case _:
+            return f"[green]A tiempo ({dias} {palabra})[/]"
+
+
+def formatear_resumen(resumen: Resumen) -> str:
+    """
+    Formatea el resumen de las tareas del usuario (conteos por estado,
+    vigencia y categorías más frecuentes) para mostrarlo en un menú.
+    """
+    colores = {
+        "Atrasada": "red",
+        "Vence hoy": "yellow",
+        "Vence pronto": "blue",
+        "A tiempo": "green",
+        "Sin fecha límite": "dim",
+    }
+    estados = [
+        f"{estilar_estado_tarea(e)}: {n}"
+        for e, n in resumen["estados"].items()
+    ]
+    vigencias = [
+        f"[{colores[v]}]{v}[/]: {n}" for v, n in resumen["vigencias"].items()
+    ]
+    categorias = [f"{c} ({n})" for c, n in resumen["categorias"].items()]
+
+    lineas = [f"📊 {' · '.join(estados)}", f"⏰ {' · '.join(vigencias)}"]
+    if categorias:
+        lineas.append(f"🏷️ {' · '.join(categorias)}")
+    return "\n".join(lineas) + "\n\n"
 
 
 def formatear_form(campos: list[Campo]) -> str:
@@ -80,20 +164,43 @@ def formatear_form(campos: list[Campo]) -> str:
 
 def generar_hash(clave: str) -> str:
     """Genera un hash para la clave del usuario."""
+    import hashlib
+
     return hashlib.sha256(clave.encode("utf-8")).hexdigest()
 
 
+def generar_huella(textos: Iterable[str]) -> str:
+    """Genera un hash corto (huella) del contenido de varios textos."""
+    import hashlib
+
+    huella = hashlib.blake2b(digest_size=16)
+    for texto in textos:
+        huella.update(texto.encode("utf-8"))
+        huella.update(b"\x1f")
+    return huella.hexdigest()
+
+
 def generar_id() -> str:
     """Genera un identificador único."""
+    import uuid
+
     return str(uuid.uuid4())
 
 
 def generar_datos_tabla(
-    tareas: list[Tarea], destacar_finalizadas: bool = False
-):
+    tareas: list[Tarea],
+    destacar_finalizadas: bool = False,
+    inicio: int = 0,
+    cantidad: int | None = None,
+    posiciones: Sequence[int] | None = None,
+) -> tuple[list[str], Iterator[list[str]]]:
     """
     Genera las filas y columnas para mostrar las tareas en una tabla.
-    Opcionalmente se pueden destacar las tareas finalizadas.
+    Opcionalmente se pueden destacar las tareas finalizadas. Si se indica
+    `cantidad`, solo se generan las filas de la página que comienza en
+    `inicio` (manteniendo el ID global de cada tarea). Si se indican
+    `posiciones` (Ej. resultados de una búsqueda), solo se muestran las
+    tareas en esas posiciones. Las filas se generan a medida que se recorren.
     """
     columnas = [
         "ID",
@@ -104,20 +211,30 @@ def generar_datos_tabla(
         "Vigencia",
         "Estado",
     ]
-    filas = [
+    fin = None if cantidad is None else inicio + cantidad
+    if posiciones is None:
+        posiciones = range(len(tareas))
+    posiciones_visibles = posiciones[inicio:fin]
+    visibles = [tareas[p] for p in posiciones_visibles]
+    filas = (
         [
-            str(indice),
+            str(posicion + 1),
             f"[white on red]{t['titulo']}[]"
             if destacar_finalizadas and t["estado"] == "Finalizada"
             else t["titulo"],
             t["categoria"],
             t["fecha_creacion"],
             t["fecha_vencimiento"],
-            estilar_vigencia_tarea(t["fecha_vencimiento"], t["estado"]),
+            vigencia,
             estilar_estado_tarea(t["estado"]),
         ]
-        for indice, t in enumerate(tareas, 1)
-    ]
+        for posicion, t, vigencia in zip(
+            posiciones_visibles,
+            visibles,
+            calcular_vigencias(visibles),
+            strict=True,
+        )
+    )
     return (columnas, filas)
 
 
@@ -0,0 +1,78 @@
+"""
+Comparación de tamaño y tiempo de carga: instantánea JSON vs binaria.
+
+Genera tareas de prueba en una carpeta temporal, las guarda en ambos
+formatos y muestra el tamaño de cada archivo y el tiempo de carga (el
+mínimo entre varias repeticiones) de todas las tareas y de las tareas de un
+único usuario:
+
+    python -m tests.benchmark_formato_binario [cantidad] [usuarios]
+"""
+
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import src.lib.archivos as gestor
+from tests.test_formato_binario import _generar_tareas
+
+
+REPETICIONES = 5
+
+
+def _medir(funcion: Callable[[], list]) -> tuple[float, int]:
+    """Retorna el mínimo de segundos utilizados y la cantidad de tareas."""
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        tareas = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, len(tareas)
+
+
+def comparar_formatos(cantidad: int, cantidad_usuarios: int):
+    """Muestra el tamaño y el tiempo de carga de cada formato."""
+    usuarios = [
+        f"{i:08x}-0000-4000-8000-000000000000"
+        for i in range(cantidad_usuarios)
+    ]
+    tareas = _generar_tareas(cantidad, usuarios)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_json = str(Path(carpeta, "tareas.json"))
+        ruta_binario = str(Path(carpeta, "tareas.bin"))
+        gestor.guardar_json(ruta_json, tareas)
+        gestor.guardar_tareas_binario(ruta_binario, tareas)
+
+        def usuario_json() -> list:
+            return [
+                t
+                for t in gestor.iterar_json_array(ruta_json)
+                if t["id_usuario"] == usuarios[0]
+            ]
+
+        mediciones = {
+            "json (todas)": lambda: gestor.leer_json(ruta_json),
+            "binario (todas)": lambda: gestor.leer_tareas_binario(
+                ruta_binario
+            ),
+            "json (un usuario)": usuario_json,
+            "binario (un usuario)": lambda: gestor.leer_tareas_binario(
+                ruta_binario, usuarios[0]
+            ),
+        }
+
+        print(f"{cantidad} tareas de {len(usuarios)} usuarios")
+        for nombre, ruta in (("json", ruta_json), ("binario", ruta_binario)):
+            print(f"  {nombre:<22}{gestor.tamano_archivo(ruta):>12} bytes")
+        for nombre, funcion in mediciones.items():
+            segundos, leidas = _medir(funcion)
+            print(f"  {nombre:<22}{segundos * 1000:>9.1f} ms ({leidas})")
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cantidad_usuarios = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    comparar_formatos(cantidad, cantidad_usuarios)
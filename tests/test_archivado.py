@@ -0,0 +1,67 @@
+"""
+Pruebas del archivado de tareas dentro de una unidad de trabajo.
+
+Las tareas archivadas dentro de servicios.unidad_de_trabajo deben agregarse
+al archivo del usuario solo al confirmar la unidad, y descartarse (junto con
+la eliminación en el motor) si la unidad falla.
+"""
+
+import pytest
+
+import src.repositorio as repo
+import src.servicios as servicios
+import src.utils as utils
+from src.definiciones.schemas import Tarea
+
+
+@pytest.fixture(autouse=True)
+def carpeta_datos(tmp_path, monkeypatch):
+    """Ejecuta cada prueba en una carpeta de datos vacía."""
+    (tmp_path / "datos").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+def _crear_tareas(id_usuario: str) -> list[Tarea]:
+    tareas: list[Tarea] = [
+        {
+            "id": utils.generar_id(),
+            "id_usuario": id_usuario,
+            "fecha_creacion": "01-01-2026",
+            "fecha_vencimiento": None,
+            "titulo": f"Tarea {numero}",
+            "categoria": "prueba",
+            "estado": estado,
+        }
+        for numero, estado in enumerate(["Finalizada", "Pendiente"])
+    ]
+    for tarea in tareas:
+        repo.crear_tarea(tarea)
+    return tareas
+
+
+def test_archivado_se_escribe_al_confirmar():
+    usuario = {"id": utils.generar_id()}
+    tareas = _crear_tareas(usuario["id"])
+    finalizada, pendiente = tareas
+
+    with servicios.unidad_de_trabajo(tareas):
+        servicios.archivar_tareas(tareas, usuario)
+        assert list(repo.obtener_tareas_archivadas(usuario["id"])) == []
+
+    assert list(repo.obtener_tareas_archivadas(usuario["id"])) == [finalizada]
+    assert repo.obtener_tareas_usuario(usuario["id"]) == [pendiente]
+
+
+def test_archivado_se_descarta_si_la_unidad_falla():
+    usuario = {"id": utils.generar_id()}
+    tareas = _crear_tareas(usuario["id"])
+    previas = list(tareas)
+
+    with pytest.raises(RuntimeError):
+        with servicios.unidad_de_trabajo(tareas):
+            servicios.archivar_tareas(tareas, usuario)
+            raise RuntimeError
+
+    assert tareas == previas
+    assert list(repo.obtener_tareas_archivadas(usuario["id"])) == []
+    assert repo.obtener_tareas_usuario(usuario["id"]) == previas
@@ -0,0 +1,57 @@
+"""
+Pruebas de la caché de lectura de archivos.
+
+Una lectura repetida de un archivo sin cambios (misma firma en os.stat) debe
+resolverse desde la caché, y una escritura en el archivo debe provocar una
+nueva lectura.
+"""
+
+import pytest
+
+import src.lib.archivos as gestor
+
+
+RUTA = "datos/contador.json"
+
+
+@pytest.fixture(autouse=True)
+def carpeta_datos(tmp_path, monkeypatch):
+    """Ejecuta cada prueba en una carpeta de datos vacía."""
+    (tmp_path / "datos").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+def _leer() -> tuple[dict, dict[str, int]]:
+    """Lee el archivo (mediante la caché) y retorna las estadísticas."""
+    datos = gestor.leer_con_cache(gestor.leer_json, RUTA)
+    return datos, gestor.estadisticas_cache()
+
+
+def test_acierto_sin_cambios_y_fallo_tras_escribir():
+    gestor.guardar_json(RUTA, {"valor": 1})
+    datos, inicial = _leer()
+    assert datos == {"valor": 1}
+
+    datos, sin_cambios = _leer()
+    assert datos == {"valor": 1}
+    assert sin_cambios["aciertos"] == inicial["aciertos"] + 1
+    assert sin_cambios["fallos"] == inicial["fallos"]
+
+    gestor.guardar_json(RUTA, {"valor": 2})
+    datos, tras_escribir = _leer()
+    assert datos == {"valor": 2}
+    assert tras_escribir["aciertos"] == sin_cambios["aciertos"]
+    assert tras_escribir["fallos"] == sin_cambios["fallos"] + 1
+
+
+def test_fallo_tras_escritura_de_otro_proceso():
+    gestor.guardar_json(RUTA, {"valor": 1})
+    _, inicial = _leer()
+
+    # Escritura sin pasar por el gestor (no invalida la caché): la firma
+    # del archivo cambia (tamaño) y la lectura vuelve a realizarse
+    with open(RUTA, "w", encoding="utf-8") as archivo:
+        archivo.write('{"valor": 100}')
+    datos, final = _leer()
+    assert datos == {"valor": 100}
+    assert final["fallos"] == inicial["fallos"] + 1
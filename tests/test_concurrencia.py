@@ -0,0 +1,156 @@
+"""
+Pruebas de estrés de escritura concurrente.
+
+Varios procesos modifican en paralelo las tareas de un mismo usuario a
+través del repositorio (motores "archivo" y "fragmentado") y se verifica
+que no se pierde ninguna escritura. Las pruebas ejercitan el bloqueo de
+archivos, el reemplazo atómico (_reemplazar_atomico), la compactación del
+diario y el reintento ante ConflictoVersion.
+"""
+
+import importlib
+import multiprocessing
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+import src.lib.archivos as gestor
+import src.repositorio as repo
+from src.definiciones.schemas import Tarea
+
+
+PROCESOS = 4
+TAREAS_POR_PROCESO = 30
+ID_USUARIO = "compartido"
+# Tamaño del diario (bytes) a partir del cual se compacta durante la prueba,
+# de modo que las compactaciones se intercalen con las escrituras
+DIARIO_MAX_BYTES = 4096
+
+
+@pytest.fixture(autouse=True)
+def carpeta_datos(tmp_path, monkeypatch):
+    """Ejecuta cada prueba en una carpeta de datos vacía."""
+    (tmp_path / "datos").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+def _ejecutar_procesos(objetivo, *argumentos):
+    """
+    Ejecuta `objetivo(numero_proceso, *argumentos)` en varios procesos
+    nuevos (spawn, sin heredar cachés ni bloqueos) que comienzan a la vez.
+    """
+    contexto = multiprocessing.get_context("spawn")
+    barrera = contexto.Barrier(PROCESOS)
+    procesos = [
+        contexto.Process(target=objetivo, args=(n, barrera, *argumentos))
+        for n in range(PROCESOS)
+    ]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join(timeout=120)
+    assert [p.exitcode for p in procesos] == [0] * PROCESOS
+
+
+def _tarea(numero_proceso: int, numero: int) -> Tarea:
+    return {
+        "id": f"{numero_proceso}-{numero}",
+        "id_usuario": ID_USUARIO,
+        "fecha_creacion": "01-01-2026",
+        "fecha_vencimiento": None,
+        "titulo": f"Tarea {numero} del proceso {numero_proceso}",
+        "categoria": "estrés",
+        "estado": "Pendiente",
+    }
+
+
+def _escribir_tareas(numero_proceso: int, barrera, motor: str):
+    """
+    Crea tareas y cambia su estado (una a una y en unidades de trabajo) en
+    el motor indicado.
+    """
+    modulo = importlib.import_module(f"src.motores.{motor}")
+    limites = SimpleNamespace(
+        DIARIO_MAX_BYTES=DIARIO_MAX_BYTES, REINTENTOS_ESCRITURA=1000
+    )
+    with (
+        mock.patch.object(repo, "_motor", return_value=modulo),
+        mock.patch.object(modulo, "Limites", limites),
+    ):
+        barrera.wait()
+        for numero in range(0, TAREAS_POR_PROCESO, 2):
+            repo.crear_tarea(_tarea(numero_proceso, numero))
+            repo.cambiar_estado_tarea(
+                f"{numero_proceso}-{numero}", "En proceso", ID_USUARIO
+            )
+            with repo.unidad_de_trabajo():
+                repo.crear_tarea(_tarea(numero_proceso, numero + 1))
+                repo.cambiar_estado_tareas(
+                    [f"{numero_proceso}-{numero + 1}"],
+                    "Finalizada",
+                    ID_USUARIO,
+                )
+
+
+def _incrementar_contador(numero_proceso: int, barrera, ruta: str):
+    """Incrementa un contador JSON con control optimista de versión."""
+    barrera.wait()
+    for _ in range(TAREAS_POR_PROCESO):
+        while True:
+            version = gestor.firma_archivo(ruta)
+            contador = gestor.leer_json(ruta) or {"valor": 0}
+            contador["valor"] += 1
+            try:
+                gestor.guardar_json(ruta, contador, version=version)
+                break
+            except gestor.ConflictoVersion:
+                continue
+
+
+@pytest.mark.parametrize("motor", ["archivo", "fragmentado"])
+def test_escrituras_concurrentes_no_se_pierden(motor):
+    _ejecutar_procesos(_escribir_tareas, motor)
+
+    modulo = importlib.import_module(f"src.motores.{motor}")
+    tareas = {t["id"]: t for t in modulo.obtener_tareas_usuario(ID_USUARIO)}
+    esperadas = {
+        f"{p}-{n}": "En proceso" if n % 2 == 0 else "Finalizada"
+        for p in range(PROCESOS)
+        for n in range(TAREAS_POR_PROCESO)
+    }
+    assert {i: t["estado"] for i, t in tareas.items()} == esperadas
+
+
+def test_diario_compactado_durante_escrituras():
+    _ejecutar_procesos(_escribir_tareas, "archivo")
+
+    # La instantánea contiene las tareas compactadas, y el diario (si
+    # existe) solo las operaciones posteriores a la última compactación
+    instantanea = gestor.leer_json("datos/tareas.json") or []
+    assert instantanea
+    assert gestor.tamano_archivo("datos/tareas.diario.jsonl") <= (
+        DIARIO_MAX_BYTES
+    )
+
+
+def test_conflicto_de_version_se_reintenta():
+    ruta = "datos/contador.json"
+    _ejecutar_procesos(_incrementar_contador, ruta)
+
+    assert gestor.leer_json(ruta) == {"valor": PROCESOS * TAREAS_POR_PROCESO}
+
+
+def test_archivos_de_bloqueo_en_carpeta_privada(tmp_path):
+    gestor.agregar_json_lineas("datos/tareas.diario.jsonl", [{"op": "x"}])
+    gestor.guardar_json("datos/contador.json", {"valor": 1})
+    gestor.guardar_csv("exportacion/tareas.csv", ["id"], [{"id": "1"}])
+    gestor.guardar_json("exportacion/manifiesto.json", {}, bloqueo=False)
+
+    assert {p.parent for p in tmp_path.rglob("*.lock")} == {
+        tmp_path / "datos" / ".locks"
+    }
+    assert sorted(p.name for p in (tmp_path / "exportacion").iterdir()) == [
+        "manifiesto.json",
+        "tareas.csv",
+    ]
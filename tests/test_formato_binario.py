@@ -0,0 +1,129 @@
+"""
+Pruebas del formato binario de tareas.
+
+Las tareas guardadas en formato binario deben leerse exactamente igual que
+las guardadas en JSON (completas y filtradas por usuario), y el motor
+"archivo" nunca debe leer una instantánea desactualizada al cambiar
+Config.FORMATO_TAREAS.
+"""
+
+import os
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import src.lib.archivos as gestor
+import src.motores.archivo as motor_archivo
+import src.utils as utils
+from src.definiciones.constantes import Rutas
+from src.definiciones.schemas import Tarea
+
+
+ESTADOS = ["Pendiente", "En proceso", "Finalizada"]
+
+
+@pytest.fixture(autouse=True)
+def carpeta_datos(tmp_path, monkeypatch):
+    """Ejecuta cada prueba en una carpeta de datos vacía."""
+    (tmp_path / "datos").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+def _generar_tareas(cantidad: int, usuarios: list[str]) -> list[Tarea]:
+    generador = random.Random(cantidad)
+    return [
+        {
+            "id": utils.generar_id(),
+            "id_usuario": generador.choice(usuarios),
+            "fecha_creacion": f"{generador.randint(1, 28):02}-01-2026",
+            "fecha_vencimiento": generador.choice([None, "29-02-2028"]),
+            "titulo": f"Tarea {numero} ({generador.choice(['ñandú', 'x'])})",
+            "categoria": generador.choice(["trabajo", "casa, compras", ""]),
+            "estado": generador.choice(ESTADOS),
+        }
+        for numero in range(cantidad)
+    ]
+
+
+def _usar_formato(monkeypatch, formato: str):
+    monkeypatch.setattr(
+        motor_archivo, "Config", SimpleNamespace(FORMATO_TAREAS=formato)
+    )
+
+
+def test_ida_y_vuelta_igual_que_json():
+    usuarios = [utils.generar_id() for _ in range(5)]
+    tareas = _generar_tareas(2000, usuarios)
+    gestor.guardar_json("datos/tareas.json", tareas)
+    gestor.guardar_tareas_binario("datos/tareas.bin", tareas)
+
+    desde_json = gestor.leer_json("datos/tareas.json")
+    assert gestor.leer_tareas_binario("datos/tareas.bin") == desde_json
+    for id_usuario in usuarios:
+        assert gestor.leer_tareas_binario(
+            "datos/tareas.bin", id_usuario, registros_por_bloque=7
+        ) == [t for t in desde_json if t["id_usuario"] == id_usuario]
+
+
+def test_archivo_vacio_o_inexistente():
+    assert gestor.leer_tareas_binario("datos/no_existe.bin") == []
+
+    gestor.guardar_tareas_binario("datos/tareas.bin", [])
+    assert gestor.leer_tareas_binario("datos/tareas.bin") == []
+
+    open("datos/vacio.bin", "wb").close()
+    assert gestor.leer_tareas_binario("datos/vacio.bin") == []
+
+
+def test_firma_invalida():
+    gestor.guardar_json("datos/tareas.json", [])
+    with pytest.raises(ValueError):
+        gestor.leer_tareas_binario("datos/tareas.json")
+
+
+@pytest.mark.parametrize(
+    ("formato_anterior", "formato_nuevo"),
+    [("binario", "json"), ("json", "binario")],
+)
+def test_cambio_de_formato_migra_la_instantanea(
+    monkeypatch, formato_anterior, formato_nuevo
+):
+    usuarios = [utils.generar_id()]
+    tareas = _generar_tareas(50, usuarios)
+    _usar_formato(monkeypatch, formato_anterior)
+    motor_archivo.aplicar_operaciones(
+        [{"op": "crear", "tarea": t} for t in tareas]
+    )
+    motor_archivo.compactar_diario()
+
+    # Instantánea desactualizada (más antigua) en el nuevo formato, Ej. de
+    # una configuración anterior
+    _usar_formato(monkeypatch, formato_nuevo)
+    ruta, ruta_otro_formato = motor_archivo._rutas_formato()
+    if formato_nuevo == "binario":
+        gestor.guardar_tareas_binario(ruta, tareas[:1])
+    else:
+        gestor.guardar_json(ruta, tareas[:1])
+    os.utime(ruta, ns=(10**9, 10**9))
+
+    assert motor_archivo.obtener_tareas() == tareas
+    assert motor_archivo.obtener_tareas_usuario(usuarios[0]) == tareas
+
+    # La siguiente modificación migra la instantánea al formato elegido
+    motor_archivo.aplicar_operaciones(
+        [
+            {
+                "op": "eliminar",
+                "ids": [tareas[0]["id"]],
+                "id_usuario": usuarios[0],
+            }
+        ]
+    )
+    assert gestor.tamano_archivo(ruta_otro_formato) == 0
+    assert gestor.tamano_archivo(Rutas.DIARIO_TAREAS) == 0
+    assert motor_archivo.obtener_tareas() == tareas[1:]
+    if formato_nuevo == "binario":
+        assert gestor.leer_tareas_binario(ruta) == tareas[1:]
+    else:
+        assert gestor.leer_json(ruta) == tareas[1:]